@@ -0,0 +1,45 @@
+"""Shared text layout for downloaded issue files."""
+
+from datetime import datetime
+
+RULE = "=" * 60
+COMMENT_RULE = "-" * 40
+
+
+def format_time(value: str) -> str:
+    """Format a GitHub ISO-8601 timestamp as YYYY-MM-DD HH:MM."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M")
+
+
+def _fmt_comment(comment: dict) -> str:
+    return f"[{comment['author']}] ({format_time(comment['created_at'])})\n{comment['body'] or '(empty)'}\n{COMMENT_RULE}\n"
+
+
+def format_issue(
+    *,
+    number: int,
+    title: str,
+    url: str,
+    author: str,
+    created_at: str,
+    labels: list[str],
+    body: str | None,
+    comments: list[dict],
+    state: str | None = None,
+    closed_at: str | None = None,
+) -> str:
+    """Build the full text of one issue file in a single string.
+
+    comments are dicts with author, created_at and body. The State/Closed
+    lines are only included when state/closed_at are given.
+    """
+    state_line = f"State: {state}\n" if state else ""
+    closed_line = f"Closed: {format_time(closed_at)}\n" if closed_at else ""
+    text = (
+        f"Issue #{number}: {title}\n{RULE}\nURL: {url}\nAuthor: {author}\n{state_line}"
+        f"Created: {format_time(created_at)}\n{closed_line}Labels: {', '.join(labels) or 'None'}\n"
+        f"\n--- Description ---\n{body or '(No description)'}\n"
+    )
+    if comments:
+        text += f"\n--- Comments ({len(comments)}) ---\n\n" + "\n".join(_fmt_comment(c) for c in comments)
+    return text
@@ -2,7 +2,13 @@
 
 import hashlib
 import json
+import os
+import queue
+import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -12,16 +18,171 @@ from tqdm import tqdm
 
 console = Console()
 
+# orjson parses/serializes the cache files several times faster; fall back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+# Claude may wrap its JSON answer in a ```json fenced block (preferred) or a bare ``` one
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)(?:```|\Z)", re.DOTALL)
+_ANY_FENCE_RE = re.compile(r"```\s*(.*?)(?:```|\Z)", re.DOTALL)
+
 # Paths
-from config import COMMAND_CENTER_DIR, ALL_REPOS_DIR
+from config import COMMAND_CENTER_DIR, ALL_REPOS_DIR, github_graphql
+
+# Repos fetched per GraphQL request (aliased repository() fields)
+GRAPHQL_REPO_BATCH = 20
 
 ANALYSIS_DIR = COMMAND_CENTER_DIR / "issue_analysis"
 ANALYSIS_META_FILE = ANALYSIS_DIR / "_meta.json"
+FILE_TREE_CACHE_DIR = COMMAND_CENTER_DIR / "file_tree_cache"
+
+
+@dataclass
+class IssueSnapshot:
+    """Plain copy of the issue fields used for analysis, built from GraphQL."""
+    number: int
+    title: str
+    body: str
+    url: str
+    author: str
+    labels: list[str]
+    created_at: datetime
+    updated_at: datetime
+    comments: int
+
+    @classmethod
+    def from_graphql(cls, node: dict) -> "IssueSnapshot":
+        return cls(
+            number=node["number"],
+            title=node["title"],
+            body=node["body"] or "",
+            url=node["url"],
+            author=node["author"]["login"] if node["author"] else "ghost",
+            labels=[l["name"] for l in node["labels"]["nodes"]],
+            created_at=_parse_github_time(node["createdAt"]),
+            updated_at=_parse_github_time(node["updatedAt"]),
+            comments=node["comments"]["totalCount"],
+        )
 
 
-def issue_hash(issue) -> str:
+def _parse_github_time(value: str) -> datetime:
+    """Parse a GitHub ISO-8601 timestamp ("...Z") into an aware datetime."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+_ISSUE_FIELDS = """
+    number title body url createdAt updatedAt
+    author { login }
+    labels(first: 20) { nodes { name } }
+    comments { totalCount }
+"""
+# Just what issue_hash() needs, used to find changed issues before downloading bodies
+_ISSUE_KEY_FIELDS = "number updatedAt comments { totalCount }"
+
+
+def _fetch_remaining_issues(owner: str, name: str, cursor: str, token: str, fields: str) -> list[dict]:
+    """Page through open issues of a single repo past the first batched page."""
+    query = f"""
+    query($owner: String!, $name: String!, $after: String) {{
+      repository(owner: $owner, name: $name) {{
+        issues(states: OPEN, first: 100, after: $after) {{
+          pageInfo {{ hasNextPage endCursor }}
+          nodes {{ {fields} }}
+        }}
+      }}
+    }}
+    """
+    nodes = []
+    while cursor:
+        data = github_graphql(query, {"owner": owner, "name": name, "after": cursor}, token)
+        issues = data["data"]["repository"]["issues"]
+        nodes.extend(issues["nodes"])
+        cursor = issues["pageInfo"]["endCursor"] if issues["pageInfo"]["hasNextPage"] else None
+    return nodes
+
+
+def _batched_repo_query(owner: str, repo_names: list[str], repo_fields, token: str) -> dict:
+    """Query several repos at once via aliased repository() fields r0, r1, ...
+
+    repo_fields(i, name) returns the selection for the i-th repo. Returns
+    {repo_name: repository data}; repos that failed to resolve are reported
+    and left out.
+    """
+    name_vars = "".join(f", $n{i}: String!" for i in range(len(repo_names)))
+    selections = "".join(
+        f"\n  r{i}: repository(owner: $owner, name: $n{i}) {{ {repo_fields(i, name)} }}"
+        for i, name in enumerate(repo_names)
+    )
+    query = f"query($owner: String!{name_vars}) {{{selections}\n}}"
+    variables = {"owner": owner, **{f"n{i}": name for i, name in enumerate(repo_names)}}
+
+    data = github_graphql(query, variables, token)
+    for error in data.get("errors") or []:
+        tqdm.write(f"GraphQL error: {error.get('message')}")
+
+    repo_data = data.get("data") or {}
+    return {name: repo_data[f"r{i}"] for i, name in enumerate(repo_names) if repo_data.get(f"r{i}")}
+
+
+def fetch_open_issues(owner: str, repo_names: list[str], token: str, fields: str = _ISSUE_FIELDS) -> dict[str, list[dict]]:
+    """Fetch open issues for a batch of repos in a single aliased GraphQL query.
+
+    Returns {repo_name: [issue node, ...]} with the requested fields. Pull
+    requests are not part of GraphQL issues().
+    """
+    selection = f"""issues(states: OPEN, first: 100) {{
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{ {fields} }}
+    }}"""
+    results = {}
+    for name, repo_data in _batched_repo_query(owner, repo_names, lambda i, name: selection, token).items():
+        issues = repo_data["issues"]
+        nodes = issues["nodes"]
+        if issues["pageInfo"]["hasNextPage"]:
+            nodes += _fetch_remaining_issues(owner, name, issues["pageInfo"]["endCursor"], token, fields)
+        results[name] = nodes
+    return results
+
+
+def fetch_issues_by_number(owner: str, numbers_by_repo: dict[str, list[int]], token: str) -> dict[str, list[IssueSnapshot]]:
+    """Fetch full details for specific issues of a batch of repos in one query."""
+    repo_names = list(numbers_by_repo)
+
+    def repo_fields(i, name):
+        return " ".join(f"i{n}: issue(number: {n}) {{ {_ISSUE_FIELDS} }}" for n in numbers_by_repo[name])
+
+    return {
+        name: [IssueSnapshot.from_graphql(node) for node in repo_data.values() if node]
+        for name, repo_data in _batched_repo_query(owner, repo_names, repo_fields, token).items()
+    }
+
+
+def issue_hash(issue: IssueSnapshot) -> str:
     """Generate hash for issue to detect changes."""
-    # Include number, title, body, and comment count
+    return _issue_key_hash(issue.number, issue.updated_at, issue.comments)
+
+
+def _issue_key_hash(number: int, updated_at: datetime, comments: int) -> str:
+    # updated_at moves on every edit (title, body, labels, comments), so the
+    # body itself doesn't need to be hashed
+    content = b"%d|%s|%d" % (number, updated_at.isoformat().encode(), comments)
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+def _legacy_issue_hash(issue: IssueSnapshot) -> str:
+    """Hash format used before issue_hash() switched to updated_at.
+
+    Only used to migrate existing cache entries without re-analyzing them.
+    """
     body = issue.body or ""
     content = f"{issue.number}|{issue.title}|{body}|{issue.comments}"
     return hashlib.sha256(content.encode()).hexdigest()[:12]
@@ -34,60 +195,113 @@ def load_analysis_cache() -> dict:
     # Load metadata
     meta = {"last_run": None}
     if ANALYSIS_META_FILE.exists():
-        with open(ANALYSIS_META_FILE) as f:
-            meta = json.load(f)
+        meta = _json_loads(ANALYSIS_META_FILE.read_bytes())
 
-    # Load per-repo analysis files
-    analyses = {}
-    for repo_file in ANALYSIS_DIR.glob("*.json"):
-        if repo_file.name.startswith("_"):
-            continue
-        repo_name = repo_file.stem
-        with open(repo_file) as f:
-            analyses[repo_name] = json.load(f)
+    # Load per-repo analysis files (reads overlap in a small thread pool)
+    repo_files = [f for f in ANALYSIS_DIR.glob("*.json") if not f.name.startswith("_")]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        analyses = dict(executor.map(lambda f: (f.stem, _json_loads(f.read_bytes())), repo_files))
 
     return {"last_run": meta.get("last_run"), "analyses": analyses}
 
 
+# Per-repo saves go through a background writer so analysis threads don't wait on disk
+_write_queue: queue.Queue = queue.Queue()
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def _analysis_writer():
+    """Background thread: write queued (repo_name, data) analyses to disk."""
+    while True:
+        repo_name, data = _write_queue.get()
+        try:
+            ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+            (ANALYSIS_DIR / f"{repo_name}.json").write_bytes(_json_dumps(data))
+        except Exception as e:
+            console.print(f"[red]Failed to save analysis for {repo_name}: {e}[/red]")
+        finally:
+            _write_queue.task_done()
+
+
 def save_repo_analysis(repo_name: str, data: dict):
-    """Save analysis for a single repo."""
-    ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
-    repo_file = ANALYSIS_DIR / f"{repo_name}.json"
-    with open(repo_file, "w") as f:
-        json.dump(data, f, indent=2)
+    """Queue analysis for a single repo to be saved. Call flush_repo_analyses() before exit."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_analysis_writer, daemon=True)
+            _writer_thread.start()
+    _write_queue.put((repo_name, data))
+
+
+def flush_repo_analyses():
+    """Block until all queued per-repo analyses have been written."""
+    _write_queue.join()
 
 
 def save_analysis_meta(last_run: str):
     """Save metadata (last run timestamp)."""
     ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
-    with open(ANALYSIS_META_FILE, "w") as f:
-        json.dump({"last_run": last_run}, f, indent=2)
+    ANALYSIS_META_FILE.write_bytes(_json_dumps({"last_run": last_run}))
+
+
+# Common non-essential directories left out of the file tree
+_TREE_SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", "node_modules", ".venv", "venv", "eggs", ".eggs"}
+
 
+def _list_tree_dir(path) -> list:
+    """List up to 20 entries of a directory, dirs first, using cached DirEntry types."""
+    with os.scandir(path) as it:
+        entries = [e for e in it if e.name not in _TREE_SKIP_DIRS]
+    entries.sort(key=lambda e: (e.is_file(follow_symlinks=False), e.name))
+    return entries[:20]  # Limit items per directory
 
-def get_file_tree(repo_path: Path, max_depth: int = 3) -> str:
+
+def get_file_tree(repo_path: Path, max_depth: int = 3, max_lines: int = 100) -> str:
     """Get a simple file tree of the repo."""
     lines = []
+    # Explicit stack of (entries, next index, prefix, depth) instead of recursion
+    stack = [(_list_tree_dir(repo_path), 0, "", 0)]
 
-    def walk(path: Path, prefix: str = "", depth: int = 0):
-        if depth > max_depth:
-            return
+    while stack and len(lines) < max_lines:
+        entries, i, prefix, depth = stack.pop()
+        if i >= len(entries):
+            continue
+        stack.append((entries, i + 1, prefix, depth))
+
+        entry = entries[i]
+        is_last = i == len(entries) - 1
+        connector = "└── " if is_last else "├── "
+        lines.append(f"{prefix}{connector}{entry.name}")
 
-        items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name))
-        # Filter out common non-essential directories
-        skip_dirs = {".git", "__pycache__", ".pytest_cache", "node_modules", ".venv", "venv", "eggs", ".eggs"}
-        items = [i for i in items if i.name not in skip_dirs]
+        if depth < max_depth and entry.is_dir(follow_symlinks=False):
+            extension = "    " if is_last else "│   "
+            stack.append((_list_tree_dir(entry.path), 0, prefix + extension, depth + 1))
 
-        for i, item in enumerate(items[:20]):  # Limit items per directory
-            is_last = i == len(items[:20]) - 1
-            connector = "└── " if is_last else "├── "
-            lines.append(f"{prefix}{connector}{item.name}")
+    return "\n".join(lines)
 
-            if item.is_dir():
-                extension = "    " if is_last else "│   "
-                walk(item, prefix + extension, depth + 1)
 
-    walk(repo_path)
-    return "\n".join(lines[:100])  # Limit total lines
+def get_file_tree_cached(repo_path: Path, repo_name: str) -> str:
+    """Get the file tree, reusing the cached render for the repo's current HEAD."""
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return get_file_tree(repo_path)
+
+    sha = result.stdout.strip()
+    cache_file = FILE_TREE_CACHE_DIR / f"{repo_name}.{sha}.tree"
+    if cache_file.exists():
+        return cache_file.read_text(encoding="utf-8")
+
+    tree = get_file_tree(repo_path)
+    FILE_TREE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Drop trees cached for older HEADs
+    for stale in FILE_TREE_CACHE_DIR.glob(f"{repo_name}.*.tree"):
+        stale.unlink(missing_ok=True)
+    cache_file.write_text(tree, encoding="utf-8")
+    return tree
 
 
 def format_issues_for_prompt(issues: list) -> str:
@@ -99,11 +313,11 @@ def format_issues_for_prompt(issues: list) -> str:
         if len(body) > 2000:
             body = body[:2000] + "\n... (truncated)"
 
-        labels = ", ".join([l.name for l in issue.labels]) or "None"
+        labels = ", ".join(issue.labels) or "None"
 
         formatted.append(f"""### Issue #{issue.number}: {issue.title}
-- URL: {issue.html_url}
-- Author: {issue.user.login}
+- URL: {issue.url}
+- Author: {issue.author}
 - Labels: {labels}
 - Created: {issue.created_at.strftime("%Y-%m-%d")}
 - Comments: {issue.comments}
@@ -116,7 +330,7 @@ def format_issues_for_prompt(issues: list) -> str:
 def analyze_repo_issues(repo_name: str, repo_path: Path, issues: list) -> list:
     """Spawn Claude Code to analyze issues for a repo."""
 
-    file_tree = get_file_tree(repo_path)
+    file_tree = get_file_tree_cached(repo_path, repo_name)
     issues_text = format_issues_for_prompt(issues)
     issue_numbers = [i.number for i in issues]
 
@@ -164,28 +378,23 @@ Important:
 '''
 
     try:
+        # Prompt goes in on stdin: file tree + issue bodies can exceed ARG_MAX as an argv entry
         result = subprocess.run(
-            ["claude", "-p", prompt],
+            ["claude", "-p"],
+            input=prompt,
             capture_output=True,
             text=True,
             cwd=str(repo_path),
             timeout=300,  # 5 min timeout
         )
 
-        output = result.stdout.strip()
-
         # Try to extract JSON from the output
         # Claude might wrap it in markdown code blocks
-        if "```json" in output:
-            start = output.find("```json") + 7
-            end = output.find("```", start)
-            output = output[start:end].strip()
-        elif "```" in output:
-            start = output.find("```") + 3
-            end = output.find("```", start)
-            output = output[start:end].strip()
-
-        analyses = json.loads(output)
+        output = result.stdout
+        match = _JSON_FENCE_RE.search(output) or _ANY_FENCE_RE.search(output)
+        payload = match.group(1).strip() if match else output.strip()
+
+        analyses = _json_loads(payload)
         return analyses
 
     except subprocess.TimeoutExpired:
@@ -202,8 +411,7 @@ Important:
 
 def analyze_issues(repo_name: str | None = None, force: bool = False, workers: int = 1):
     """Analyze issues across repos using Claude Code."""
-    from github import Github
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from concurrent.futures import as_completed
     from config import get_all_repos, get_github_token, GITHUB_OWNER
 
     token = get_github_token()
@@ -211,7 +419,6 @@ def analyze_issues(repo_name: str | None = None, force: bool = False, workers: i
         console.print("[red]GITHUB_TOKEN not set.[/red]")
         return
 
-    g = Github(token)
     repos = get_all_repos()
 
     if repo_name:
@@ -228,31 +435,46 @@ def analyze_issues(repo_name: str | None = None, force: bool = False, workers: i
     repos_processed = 0
     repos_skipped = 0
 
-    # Filter to repos with issues first (parallel scanning)
+    # Filter to repos with changed issues first (batched GraphQL, batches fetched in parallel).
+    # Pass 1 only fetches (number, updatedAt, comments) to compare against the cache;
+    # full bodies are downloaded only for issues that are new or changed.
     repos_with_issues = []
-    console.print(f"[dim]Scanning {len(repos)} repos for open issues (8 threads)...[/dim]")
+    batches = [repos[i:i + GRAPHQL_REPO_BATCH] for i in range(0, len(repos), GRAPHQL_REPO_BATCH)]
+    console.print(f"[dim]Scanning {len(repos)} repos for open issues ({len(batches)} GraphQL batches)...[/dim]")
 
-    def fetch_issues(repo):
+    def fetch_issues(batch):
         try:
-            gh_repo = g.get_repo(f"{GITHUB_OWNER}/{repo.name}")
-            issues = [i for i in gh_repo.get_issues(state="open") if not i.pull_request]
-            return (repo, issues) if issues else None
+            keys_by_repo = fetch_open_issues(GITHUB_OWNER, [r.name for r in batch], token, fields=_ISSUE_KEY_FIELDS)
+            changed = {}
+            for name, nodes in keys_by_repo.items():
+                cached_hashes = {i["hash"] for i in cache["analyses"].get(name, {}).get("issues", [])}
+                numbers = [
+                    n["number"] for n in nodes
+                    if force or _issue_key_hash(
+                        n["number"], _parse_github_time(n["updatedAt"]), n["comments"]["totalCount"]
+                    ) not in cached_hashes
+                ]
+                if numbers:
+                    changed[name] = numbers
+            issues_by_repo = fetch_issues_by_number(GITHUB_OWNER, changed, token) if changed else {}
         except Exception as e:
-            tqdm.write(f"[red]Error checking {repo.name}: {e}[/red]")
-            return None
+            tqdm.write(f"Error checking {', '.join(r.name for r in batch)}: {e}")
+            return [], 0
+        unchanged = sum(1 for name, nodes in keys_by_repo.items() if nodes and name not in changed)
+        return [(repo, issues_by_repo[repo.name]) for repo in batch if issues_by_repo.get(repo.name)], unchanged
 
     with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = {executor.submit(fetch_issues, repo): repo for repo in repos}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Scanning repos", unit="repo"):
-            result = future.result()
-            if result:
-                repos_with_issues.append(result)
+        futures = [executor.submit(fetch_issues, batch) for batch in batches]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Scanning repos", unit="batch"):
+            changed_repos, unchanged = future.result()
+            repos_with_issues.extend(changed_repos)
+            repos_skipped += unchanged
 
-    if not repos_with_issues:
+    if not repos_with_issues and not repos_skipped:
         console.print("[yellow]No repos with open issues found.[/yellow]")
         return
 
-    console.print(f"\n[cyan]Found {len(repos_with_issues)} repos with open issues[/cyan]")
+    console.print(f"\n[cyan]Found {len(repos_with_issues)} repos with new or changed issues[/cyan]")
     console.print(f"[cyan]Using {workers} parallel worker(s)[/cyan]\n")
 
     def process_repo(repo_issues_tuple):
@@ -266,25 +488,38 @@ def analyze_issues(repo_name: str | None = None, force: bool = False, workers: i
 
             if not repo_path.exists():
                 tqdm.write(f"  Cloning {repo.name}...")
+                # Partial clone: only the blobs needed for the checkout are fetched,
+                # anything else Claude touches later is pulled on demand by git
                 subprocess.run(
-                    ["git", "clone", "--depth", "1",
+                    ["git", "clone", "--depth", "1", "--filter=blob:none",
                      f"https://github.com/{GITHUB_OWNER}/{repo.name}.git",
                      str(repo_path)],
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     check=True,
                 )
 
             # Check which issues need analysis
             cached_repo = cache["analyses"].get(repo.name, {"issues": []})
-            cached_hashes = {i["hash"] for i in cached_repo.get("issues", [])}
+            cached_by_hash = {i["hash"]: i for i in cached_repo.get("issues", [])}
 
             issues_to_analyze = []
+            migrated = False
             for issue in issues:
                 h = issue_hash(issue)
-                if force or h not in cached_hashes:
+                if not force and h not in cached_by_hash:
+                    # One-shot migration of entries hashed with the old format
+                    legacy = cached_by_hash.get(_legacy_issue_hash(issue))
+                    if legacy is not None:
+                        legacy["hash"] = h
+                        cached_by_hash[h] = legacy
+                        migrated = True
+                if force or h not in cached_by_hash:
                     issues_to_analyze.append(issue)
 
             if not issues_to_analyze:
+                if migrated:
+                    save_repo_analysis(repo.name, cached_repo)
                 result["skipped"] = True
                 return result
 
@@ -295,11 +530,12 @@ def analyze_issues(repo_name: str | None = None, force: bool = False, workers: i
             if analyses:
                 # Merge with existing cache
                 existing_issues = {i["number"]: i for i in cached_repo.get("issues", [])}
+                issues_by_number = {i.number: i for i in issues_to_analyze}
 
                 for analysis in analyses:
                     issue_num = analysis["number"]
                     # Find matching issue for metadata
-                    matching = next((i for i in issues_to_analyze if i.number == issue_num), None)
+                    matching = issues_by_number.get(issue_num)
                     if matching:
                         # Preserve status if issue was already analyzed
                         old_status = existing_issues.get(issue_num, {}).get("status", "new")
@@ -308,8 +544,8 @@ def analyze_issues(repo_name: str | None = None, force: bool = False, workers: i
                             "number": issue_num,
                             "hash": issue_hash(matching),
                             "title": matching.title,
-                            "url": matching.html_url,
-                            "author": matching.user.login,
+                            "url": matching.url,
+                            "author": matching.author,
                             "status": old_status,  # new | waiting-for-confirmation | closed
                             "comments_at_analysis": matching.comments,
                             "analysis": {
@@ -354,7 +590,8 @@ def analyze_issues(repo_name: str | None = None, force: bool = False, workers: i
             except Exception as e:
                 console.print(f"[red]Error processing {repo_name}: {e}[/red]")
 
-    # Save metadata
+    # Wait for queued per-repo writes, then save metadata
+    flush_repo_analyses()
     save_analysis_meta(datetime.now().isoformat())
 
     # Summary
@@ -1,8 +1,9 @@
 """Clone all ComfyUI nodes to a local folder via symlinks into setup environments."""
 
-import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -11,8 +12,104 @@ from config import get_all_repos, get_repos_by_category, ALL_REPOS_DIR, INSTALL_
 
 console = Console()
 
+def _setup_missing_envs(repos, config_map: dict) -> int:
+    """Run setup for every environment that is missing one of the given repos.
+
+    Runs serially before the parallel link pass: setup_comfyui() keeps module-level
+    logger/timing state and reinstall=True wipes the whole env, which would pull the
+    rug out from under workers pulling or symlinking inside it.
+
+    Returns the number of environments set up.
+    """
+    envs = {}
+    for repo in repos:
+        if repo.name not in config_map:
+            continue
+        config_name, folder_name = config_map[repo.name]
+        if not (INSTALL_DIR / folder_name / "ComfyUI" / "custom_nodes" / repo.name).exists():
+            envs.setdefault(folder_name, config_name)
 
-def clone_all_repos(pull_existing: bool = False, threshold: int = 0):
+    setup_count = 0
+    for folder_name, config_name in envs.items():
+        console.print(f"[cyan]Setting up {config_name} ({folder_name})...[/cyan]")
+        try:
+            setup_comfyui(config_name, reinstall=True)
+            setup_count += 1
+        except Exception as e:
+            console.print(f"[red]Failed setup for {config_name}: {e}[/red]")
+    return setup_count
+
+
+def _link_repo(repo, config_map: dict, pull_existing: bool) -> dict:
+    """Pull or symlink a single repo. Used by thread pool.
+
+    Environments must already be set up (see _setup_missing_envs).
+
+    Returns {"status": ..., "message": ..., "replaced": bool} where
+    status is one of symlinked | pulled | skipped | skipped_no_config | failed.
+    """
+    result = {"status": "failed", "message": "", "replaced": False}
+    link_path = ALL_REPOS_DIR / repo.name
+
+    # 1. Check config mapping
+    if repo.name not in config_map:
+        result["status"] = "skipped_no_config"
+        return result
+
+    _, folder_name = config_map[repo.name]
+    env_dir = INSTALL_DIR / folder_name
+    target_path = env_dir / "ComfyUI" / "custom_nodes" / repo.name
+
+    # 2. Verify target path exists after setup
+    if not target_path.exists():
+        result["message"] = f"{repo.name}: target not found at {target_path}"
+        return result
+
+    # 3. Handle existing entries in all_repos/
+    if link_path.is_symlink():
+        current_target = link_path.resolve()
+        if current_target == target_path.resolve():
+            # Correct symlink already exists
+            if pull_existing:
+                proc = subprocess.run(
+                    ["git", "-C", str(target_path), "pull", "--ff-only"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                )
+                if proc.returncode == 0:
+                    result["status"] = "pulled"
+                else:
+                    result["message"] = f"Failed to pull {repo.name}: {proc.stderr.strip()}"
+            else:
+                result["status"] = "skipped"
+            return result
+        else:
+            # Wrong/broken symlink - remove and recreate
+            link_path.unlink()
+
+    elif link_path.exists():
+        # Real directory (old behavior) - check for uncommitted changes
+        proc = subprocess.run(
+            ["git", "-C", str(link_path), "status", "--porcelain"],
+            capture_output=True, text=True,
+        )
+        if proc.returncode == 0 and proc.stdout.strip():
+            result["message"] = f"Skipped {repo.name} (has uncommitted changes in old clone)"
+            return result
+        # Safe to remove
+        shutil.rmtree(link_path)
+        result["replaced"] = True
+
+    # 4. Create symlink
+    try:
+        link_path.symlink_to(target_path)
+        result["status"] = "symlinked"
+    except OSError as e:
+        result["message"] = f"Failed to symlink {repo.name}: {e}"
+
+    return result
+
+
+def clone_all_repos(pull_existing: bool = False, threshold: int = 0, workers: int = 16):
     """Symlink all ComfyUI node repos into all_repos from setup environments."""
     ALL_REPOS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -27,169 +124,102 @@ def clone_all_repos(pull_existing: bool = False, threshold: int = 0):
         label += f" (>= {threshold} stars)"
     console.print(f"[bold]{label} to {ALL_REPOS_DIR}[/bold]\n")
 
-    setup_count = 0
-    symlinked = 0
+    setup_count = _setup_missing_envs(repos, config_map)
+
+    counts = {"symlinked": 0, "pulled": 0, "skipped": 0, "skipped_no_config": 0, "failed": 0}
     replaced = 0
-    skipped_no_config = 0
-    skipped = 0
-    pulled = 0
-    failed = 0
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        for repo in repos:
-            link_path = ALL_REPOS_DIR / repo.name
-            task = progress.add_task(f"{repo.name}", total=None)
-
-            # 1. Check config mapping
-            if repo.name not in config_map:
-                skipped_no_config += 1
-                progress.update(task, description=f"[dim]Skipped {repo.name} (no setup config)[/dim]")
-                progress.remove_task(task)
-                continue
-
-            config_name, folder_name = config_map[repo.name]
-            env_dir = INSTALL_DIR / folder_name
-            target_path = env_dir / "ComfyUI" / "custom_nodes" / repo.name
-
-            # 2. If the target repo folder doesn't exist, run setup
-            if not target_path.exists():
-                progress.update(task, description=f"[cyan]Setting up {folder_name} environment...[/cyan]")
-                saved_cwd = os.getcwd()
+        task = progress.add_task(f"Processing {len(repos)} repos...", total=len(repos))
+
+        # Progress is only touched from this thread; workers report back via their result dicts
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_link_repo, repo, config_map, pull_existing): repo for repo in repos}
+            for future in as_completed(futures):
+                repo = futures[future]
                 try:
-                    setup_comfyui(config_name, reinstall=True)
-                    setup_count += 1
+                    result = future.result()
                 except Exception as e:
-                    failed += 1
-                    progress.update(task, description=f"[red]Failed setup for {repo.name}: {e}[/red]")
-                    progress.remove_task(task)
-                    continue
-                finally:
-                    os.chdir(saved_cwd)
-
-            # 3. Verify target path exists after setup
-            if not target_path.exists():
-                failed += 1
-                progress.update(task, description=f"[red]{repo.name}: target not found at {target_path}[/red]")
-                progress.remove_task(task)
-                continue
-
-            # 4. Handle existing entries in all_repos/
-            if link_path.is_symlink():
-                current_target = link_path.resolve()
-                if current_target == target_path.resolve():
-                    # Correct symlink already exists
-                    if pull_existing:
-                        progress.update(task, description=f"[yellow]Pulling {repo.name}...[/yellow]")
-                        result = subprocess.run(
-                            ["git", "-C", str(target_path), "pull", "--ff-only"],
-                            capture_output=True, text=True,
-                        )
-                        if result.returncode == 0:
-                            pulled += 1
-                            progress.update(task, description=f"[blue]Pulled {repo.name}[/blue]")
-                        else:
-                            failed += 1
-                            progress.update(task, description=f"[red]Failed to pull {repo.name}[/red]")
-                    else:
-                        skipped += 1
-                        progress.update(task, description=f"[dim]Skipped {repo.name} (symlink exists)[/dim]")
-                    progress.remove_task(task)
-                    continue
-                else:
-                    # Wrong/broken symlink - remove and recreate
-                    link_path.unlink()
-
-            elif link_path.exists():
-                # Real directory (old behavior) - check for uncommitted changes
-                progress.update(task, description=f"[yellow]Checking {repo.name} for uncommitted changes...[/yellow]")
-                result = subprocess.run(
-                    ["git", "-C", str(link_path), "status", "--porcelain"],
-                    capture_output=True, text=True,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    failed += 1
-                    progress.update(task, description=f"[red]Skipped {repo.name} (has uncommitted changes in old clone)[/red]")
-                    progress.remove_task(task)
-                    continue
-                # Safe to remove
-                shutil.rmtree(link_path)
-                replaced += 1
-
-            # 5. Create symlink
-            progress.update(task, description=f"[cyan]Symlinking {repo.name}...[/cyan]")
-            try:
-                link_path.symlink_to(target_path)
-                symlinked += 1
-                progress.update(task, description=f"[green]Symlinked {repo.name}[/green]")
-            except OSError as e:
-                failed += 1
-                progress.update(task, description=f"[red]Failed to symlink {repo.name}: {e}[/red]")
-
-            progress.remove_task(task)
+                    result = {"status": "failed", "message": f"{repo.name}: {e}", "replaced": False}
+
+                counts[result["status"]] += 1
+                replaced += result["replaced"]
+                if result["status"] == "failed":
+                    progress.console.print(f"[red]{result['message']}[/red]")
+                progress.update(task, advance=1, description=f"[dim]Done {repo.name}[/dim]")
 
     console.print()
     if setup_count:
         console.print(f"[cyan]Environments set up: {setup_count}[/cyan]")
-    console.print(f"[green]Symlinked: {symlinked}[/green]")
+    console.print(f"[green]Symlinked: {counts['symlinked']}[/green]")
     if replaced:
         console.print(f"[yellow]Replaced (old clone -> symlink): {replaced}[/yellow]")
-    if pulled:
-        console.print(f"[blue]Pulled: {pulled}[/blue]")
-    console.print(f"[dim]Skipped (exists): {skipped}[/dim]")
-    if skipped_no_config:
-        console.print(f"[dim]Skipped (no setup config): {skipped_no_config}[/dim]")
-    if failed:
-        console.print(f"[red]Failed: {failed}[/red]")
+    if counts["pulled"]:
+        console.print(f"[blue]Pulled: {counts['pulled']}[/blue]")
+    console.print(f"[dim]Skipped (exists): {counts['skipped']}[/dim]")
+    if counts["skipped_no_config"]:
+        console.print(f"[dim]Skipped (no setup config): {counts['skipped_no_config']}[/dim]")
+    if counts["failed"]:
+        console.print(f"[red]Failed: {counts['failed']}[/red]")
     console.print(f"\n[bold]Repos at:[/bold] {ALL_REPOS_DIR}")
 
 
-def pull_all_repos():
+def _pull_repo(repo) -> tuple[str, str, str | None]:
+    """Pull a single repo. Used by thread pool.
+
+    Returns (status, repo name, error) with status pulled | skipped | failed.
+    """
+    repo_dir = ALL_REPOS_DIR / repo.name
+    if not repo_dir.exists():
+        return "skipped", repo.name, None
+
+    # Fetch (the network part, which git parallelizes across remotes itself),
+    # then fast-forward locally from FETCH_HEAD
+    for cmd in (["fetch", "--quiet"], ["merge", "--ff-only", "--quiet", "FETCH_HEAD"]):
+        result = subprocess.run(
+            ["git", "-C", str(repo_dir), *cmd],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if result.returncode != 0:
+            return "failed", repo.name, result.stderr.strip()
+    return "pulled", repo.name, None
+
+
+def pull_all_repos(workers: int = 16):
     """Pull latest changes for all existing ComfyUI node repos."""
     repos = get_repos_by_category("comfyui")
 
     console.print(f"[bold]Pulling ComfyUI node repos in {ALL_REPOS_DIR}[/bold]\n")
 
-    pulled = 0
-    skipped = 0
-    failed = 0
+    counts = {"pulled": 0, "skipped": 0, "failed": 0}
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        for repo in repos:
-            repo_dir = ALL_REPOS_DIR / repo.name
-            task = progress.add_task(f"{repo.name}", total=None)
-
-            if repo_dir.exists():
-                progress.update(task, description=f"[yellow]Pulling {repo.name}...[/yellow]")
-                result = subprocess.run(
-                    ["git", "-C", str(repo_dir), "pull", "--ff-only"],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    pulled += 1
-                    progress.update(task, description=f"[green]Pulled {repo.name}[/green]")
-                else:
-                    failed += 1
-                    progress.update(task, description=f"[red]Failed to pull {repo.name}[/red]")
-                    console.print(f"  [dim]{result.stderr.strip()}[/dim]")
-            else:
-                skipped += 1
-                progress.update(task, description=f"[dim]Skipped {repo.name} (not cloned)[/dim]")
-
-            progress.remove_task(task)
+        task = progress.add_task(f"Pulling {len(repos)} repos...", total=len(repos))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_pull_repo, repo) for repo in repos]
+            for future in as_completed(futures):
+                status, name, error = future.result()
+                counts[status] += 1
+                if status == "failed":
+                    progress.console.print(f"[red]Failed to pull {name}[/red]")
+                    progress.console.print(f"  [dim]{error}[/dim]")
+                progress.update(task, advance=1, description=f"[dim]Done {name}[/dim]")
 
     console.print()
-    console.print(f"[green]Pulled: {pulled}[/green]")
-    if skipped:
-        console.print(f"[dim]Skipped (not cloned): {skipped}[/dim]")
-    if failed:
-        console.print(f"[red]Failed: {failed}[/red]")
+    console.print(f"[green]Pulled: {counts['pulled']}[/green]")
+    if counts["skipped"]:
+        console.print(f"[dim]Skipped (not cloned): {counts['skipped']}[/dim]")
+    if counts["failed"]:
+        console.print(f"[red]Failed: {counts['failed']}[/red]")
     console.print(f"\n[bold]Repos at:[/bold] {ALL_REPOS_DIR}")
@@ -32,9 +32,10 @@ def clone_bindings_repos(pull_existing: bool = False):
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
+        # One task for the whole run; per-repo state goes in its description
+        task = progress.add_task(f"Cloning {len(repos)} repos...", total=len(repos))
         for repo in repos:
             repo_dir = BINDINGS_REPOS_DIR / repo.name
-            task = progress.add_task(f"{repo.name}", total=None)
 
             if repo_dir.exists():
                 if pull_existing:
@@ -75,7 +76,7 @@ def clone_bindings_repos(pull_existing: bool = False):
                     progress.update(task, description=f"[red]Failed {repo.name}[/red]")
                     console.print(f"  [dim]{result.stderr.strip()}[/dim]")
 
-            progress.remove_task(task)
+            progress.advance(task)
 
     console.print()
     console.print(f"[green]Cloned: {cloned}[/green]")
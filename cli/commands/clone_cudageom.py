@@ -40,9 +40,10 @@ def clone_cudageom_repos(pull_existing: bool = False):
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
+        # One task for the whole run; per-repo state goes in its description
+        task = progress.add_task(f"Cloning {len(CUDAGEOM_REPOS)} repos...", total=len(CUDAGEOM_REPOS))
         for owner, name in CUDAGEOM_REPOS:
             repo_dir = CUDAGEOM_REPOS_DIR / name
-            task = progress.add_task(f"{name}", total=None)
 
             if repo_dir.exists():
                 if pull_existing:
@@ -83,7 +84,7 @@ def clone_cudageom_repos(pull_existing: bool = False):
                     progress.update(task, description=f"[red]Failed {name}[/red]")
                     console.print(f"  [dim]{result.stderr.strip()}[/dim]")
 
-            progress.remove_task(task)
+            progress.advance(task)
 
     console.print()
     console.print(f"[green]Cloned: {cloned}[/green]")
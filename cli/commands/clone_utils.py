@@ -1,17 +1,59 @@
 """Clone all 'tools' category repos to a local folder."""
 
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from commands.get import force_remove_readonly, git_clone_cmd, is_filter_unsupported, is_git_repo
 from config import get_all_repos, GITHUB_OWNER, get_github_token, UTILS_REPOS_DIR
 
 console = Console()
 
 
-def clone_utils_repos(pull_existing: bool = False):
+def _process_repo(repo, pull_existing: bool, token: str | None) -> tuple[str, str, str | None]:
+    """Clone or pull a single repo. Used by thread pool.
+
+    Returns (status, repo name, error) with status cloned | pulled | skipped | failed.
+    """
+    repo_dir = UTILS_REPOS_DIR / repo.name
+
+    if repo_dir.exists() and not is_git_repo(repo_dir):
+        # Broken checkout (e.g. interrupted clone): remove it and clone fresh
+        shutil.rmtree(repo_dir, onerror=force_remove_readonly)
+
+    if repo_dir.exists():
+        if not pull_existing:
+            return "skipped", repo.name, None
+        # Fetch only the new commits (shallow-aware), then fast-forward only so local work is never overwritten
+        for cmd in (["fetch", "--quiet"], ["merge", "--ff-only", "--quiet", "FETCH_HEAD"]):
+            result = subprocess.run(
+                ["git", "-C", str(repo_dir), *cmd],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            if result.returncode != 0:
+                return "failed", repo.name, result.stderr.strip()
+        return "pulled", repo.name, None
+
+    if token:
+        clone_url = f"https://{token}@github.com/{GITHUB_OWNER}/{repo.name}.git"
+    else:
+        clone_url = f"https://github.com/{GITHUB_OWNER}/{repo.name}.git"
+
+    result = subprocess.run(git_clone_cmd(clone_url, repo_dir), capture_output=True, text=True)
+    if result.returncode != 0 and is_filter_unsupported(result.stderr):
+        result = subprocess.run(git_clone_cmd(clone_url, repo_dir, partial=False), capture_output=True, text=True)
+    if result.returncode == 0:
+        return "cloned", repo.name, None
+    return "failed", repo.name, result.stderr.strip()
+
+
+def clone_utils_repos(pull_existing: bool = False, workers: int = 8):
     """Clone all 'tools' category repos to the utils directory."""
     UTILS_REPOS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -22,66 +64,32 @@ def clone_utils_repos(pull_existing: bool = False):
 
     console.print(f"[bold]Cloning {len(repos)} tools repos to {UTILS_REPOS_DIR}[/bold]\n")
 
-    cloned = 0
-    skipped = 0
-    pulled = 0
-    failed = 0
+    counts = {"cloned": 0, "pulled": 0, "skipped": 0, "failed": 0}
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        for repo in repos:
-            repo_dir = UTILS_REPOS_DIR / repo.name
-            task = progress.add_task(f"{repo.name}", total=None)
-
-            if repo_dir.exists():
-                if pull_existing:
-                    progress.update(task, description=f"[yellow]Pulling {repo.name}...[/yellow]")
-                    result = subprocess.run(
-                        ["git", "-C", str(repo_dir), "pull", "--ff-only"],
-                        capture_output=True,
-                        text=True,
-                    )
-                    if result.returncode == 0:
-                        pulled += 1
-                        progress.update(task, description=f"[blue]Pulled {repo.name}[/blue]")
-                    else:
-                        failed += 1
-                        progress.update(task, description=f"[red]Failed to pull {repo.name}[/red]")
-                else:
-                    skipped += 1
-                    progress.update(task, description=f"[dim]Skipped {repo.name} (exists)[/dim]")
-            else:
-                progress.update(task, description=f"[cyan]Cloning {repo.name}...[/cyan]")
-
-                if token:
-                    clone_url = f"https://{token}@github.com/{GITHUB_OWNER}/{repo.name}.git"
-                else:
-                    clone_url = f"https://github.com/{GITHUB_OWNER}/{repo.name}.git"
-
-                result = subprocess.run(
-                    ["git", "clone", "--depth", "1", clone_url, str(repo_dir)],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.returncode == 0:
-                    cloned += 1
-                    progress.update(task, description=f"[green]Cloned {repo.name}[/green]")
-                else:
-                    failed += 1
-                    progress.update(task, description=f"[red]Failed {repo.name}[/red]")
-                    console.print(f"  [dim]{result.stderr.strip()}[/dim]")
-
-            progress.remove_task(task)
+        task = progress.add_task(f"Cloning {len(repos)} repos...", total=len(repos))
+
+        # Progress is only touched from this thread; workers report back via return values
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(repos)))) as executor:
+            futures = [executor.submit(_process_repo, repo, pull_existing, token) for repo in repos]
+            for future in as_completed(futures):
+                status, name, error = future.result()
+                counts[status] += 1
+                if status == "failed":
+                    progress.console.print(f"[red]Failed {name}[/red]")
+                    if error:
+                        progress.console.print(f"  [dim]{error}[/dim]")
+                progress.update(task, advance=1, description=f"[dim]Done {name}[/dim]")
 
     console.print()
-    console.print(f"[green]Cloned: {cloned}[/green]")
-    if pulled:
-        console.print(f"[blue]Pulled: {pulled}[/blue]")
-    console.print(f"[dim]Skipped: {skipped}[/dim]")
-    if failed:
-        console.print(f"[red]Failed: {failed}[/red]")
+    console.print(f"[green]Cloned: {counts['cloned']}[/green]")
+    if counts["pulled"]:
+        console.print(f"[blue]Pulled: {counts['pulled']}[/blue]")
+    console.print(f"[dim]Skipped: {counts['skipped']}[/dim]")
+    if counts["failed"]:
+        console.print(f"[red]Failed: {counts['failed']}[/red]")
     console.print(f"\n[bold]Repos at:[/bold] {UTILS_REPOS_DIR}")
@@ -1,18 +1,119 @@
 """Download GitHub issues from all repos to text files."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from commands._issue_format import format_issue
+
 console = Console()
 
 # Target directory: /home/shadeform/issues/
 TARGET_BASE = Path(__file__).parent.parent.parent.parent / "issues"
 
-
-def download_all_issues(include_closed: bool = False):
+# Issue bodies and comments change often, so cached query pages are only reused briefly
+QUERY_CACHE_SECONDS = 60
+
+# One request returns a page of issues together with their first 100 comments
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $states: [IssueState!], $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(states: $states, first: 50, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title url state body createdAt closedAt
+        author { login }
+        labels(first: 20) { nodes { name } }
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { author { login } createdAt body }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _login(author: dict | None) -> str:
+    return author["login"] if author else "ghost"
+
+
+def _fetch_all_comments(owner: str, repo_name: str, number: int, token: str, refresh: bool) -> list[dict]:
+    """REST fallback for issues with more comments than the GraphQL page holds."""
+    from config import github_get_all
+
+    comments = github_get_all(
+        f"/repos/{owner}/{repo_name}/issues/{number}/comments?per_page=100", token, refresh
+    )
+    return [
+        {"author": c["user"]["login"], "created_at": c["created_at"], "body": c["body"]}
+        for c in comments
+    ]
+
+
+def _download_repo_issues(token: str, owner: str, repo_name: str, states: list[str], refresh: bool) -> int:
+    """Download all issues of one repo. Used by thread pool. Returns issues written."""
+    from config import github_graphql
+
+    issues = []
+    cursor = None
+    while True:
+        data = github_graphql(
+            ISSUES_QUERY,
+            {"owner": owner, "name": repo_name, "states": states, "after": cursor},
+            token,
+            max_age=0 if refresh else QUERY_CACHE_SECONDS,
+        )
+        if data.get("errors"):
+            raise RuntimeError(data["errors"][0].get("message", "GraphQL error"))
+        page = data["data"]["repository"]["issues"]
+        issues.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+    if not issues:
+        return 0
+
+    # Create repo output directory
+    output_dir = TARGET_BASE / repo_name
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for issue in issues:
+        filename = f"issue_{issue['number']}.txt"
+        filepath = output_dir / filename
+
+        if issue["comments"]["pageInfo"]["hasNextPage"]:
+            comments = _fetch_all_comments(owner, repo_name, issue["number"], token, refresh)
+        else:
+            comments = [
+                {"author": _login(c["author"]), "created_at": c["createdAt"], "body": c["body"]}
+                for c in issue["comments"]["nodes"]
+            ]
+
+        text = format_issue(
+            number=issue["number"],
+            title=issue["title"],
+            url=issue["url"],
+            author=_login(issue["author"]),
+            state=issue["state"].lower(),
+            created_at=issue["createdAt"],
+            closed_at=issue["closedAt"],
+            labels=[l["name"] for l in issue["labels"]["nodes"]],
+            body=issue["body"],
+            comments=comments,
+        )
+
+        # Write file (one write; explicit UTF-8 so emoji etc. work on Windows)
+        filepath.write_text(text, encoding="utf-8")
+
+    return len(issues)
+
+
+def download_all_issues(include_closed: bool = False, refresh: bool = False, workers: int = 8):
     """Download issues from all repos as txt files."""
-    from github import Github
     from config import get_all_repos, get_github_token, GITHUB_OWNER
 
     token = get_github_token()
@@ -21,10 +122,10 @@ def download_all_issues(include_closed: bool = False):
         console.print("Set it with: export GITHUB_TOKEN='your_token'")
         return
 
-    g = Github(token)
     repos = get_all_repos()
 
-    state = "all" if include_closed else "open"
+    # GraphQL issues() never includes pull requests
+    states = ["OPEN", "CLOSED"] if include_closed else ["OPEN"]
 
     # Create base output directory
     TARGET_BASE.mkdir(parents=True, exist_ok=True)
@@ -39,67 +140,21 @@ def download_all_issues(include_closed: bool = False):
     ) as progress:
         task = progress.add_task("Processing repos...", total=len(repos))
 
-        for repo in repos:
-            progress.update(task, description=f"Processing {repo.name}...")
-
-            try:
-                gh_repo = g.get_repo(f"{GITHUB_OWNER}/{repo.name}")
-                issues = list(gh_repo.get_issues(state=state))
-
-                # Filter out PRs
-                issues = [i for i in issues if not i.pull_request]
-
-                if not issues:
-                    progress.advance(task)
-                    continue
-
-                # Create repo output directory
-                output_dir = TARGET_BASE / repo.name
-                output_dir.mkdir(parents=True, exist_ok=True)
-
-                repos_with_issues += 1
-
-                for issue in issues:
-                    filename = f"issue_{issue.number}.txt"
-                    filepath = output_dir / filename
-
-                    # Build issue content
-                    content = []
-                    content.append(f"Issue #{issue.number}: {issue.title}")
-                    content.append("=" * 60)
-                    content.append(f"URL: {issue.html_url}")
-                    content.append(f"Author: {issue.user.login}")
-                    content.append(f"State: {issue.state}")
-                    content.append(f"Created: {issue.created_at.strftime('%Y-%m-%d %H:%M')}")
-                    if issue.closed_at:
-                        content.append(f"Closed: {issue.closed_at.strftime('%Y-%m-%d %H:%M')}")
-                    content.append(f"Labels: {', '.join([l.name for l in issue.labels]) or 'None'}")
-                    content.append("")
-                    content.append("--- Description ---")
-                    content.append(issue.body or "(No description)")
-                    content.append("")
-
-                    # Fetch comments
-                    comments = list(issue.get_comments())
-                    if comments:
-                        content.append(f"--- Comments ({len(comments)}) ---")
-                        content.append("")
-                        for comment in comments:
-                            content.append(f"[{comment.user.login}] ({comment.created_at.strftime('%Y-%m-%d %H:%M')})")
-                            content.append(comment.body or "(empty)")
-                            content.append("-" * 40)
-                            content.append("")
-
-                    # Write file
-                    with open(filepath, "w") as f:
-                        f.write("\n".join(content))
-
-                    total_issues += 1
-
-            except Exception as e:
-                console.print(f"[red]Error processing {repo.name}: {e}[/red]")
-
-            progress.advance(task)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_download_repo_issues, token, GITHUB_OWNER, repo.name, states, refresh): repo.name
+                for repo in repos
+            }
+            for future in as_completed(futures):
+                repo_name = futures[future]
+                try:
+                    count = future.result()
+                    if count:
+                        repos_with_issues += 1
+                        total_issues += count
+                except Exception as e:
+                    console.print(f"[red]Error processing {repo_name}: {e}[/red]")
+                progress.update(task, advance=1, description=f"Processed {repo_name}")
 
     console.print()
     console.print(f"[green]Downloaded {total_issues} issues from {repos_with_issues} repos to:[/green]")
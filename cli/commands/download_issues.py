@@ -5,16 +5,17 @@ from pathlib import Path
 from rich.console import Console
 from rich.prompt import Prompt
 
+from commands._issue_format import format_issue
+
 console = Console()
 
 # Target directory: parent of coding-scripts
 TARGET_BASE = Path(__file__).parent.parent.parent.parent  # /home/shadeform
 
 
-def download_issues():
+def download_issues(refresh: bool = False):
     """Interactively select a repo and download its issues as txt files."""
-    from github import Github
-    from config import get_all_repos, get_github_token, GITHUB_OWNER
+    from config import get_all_repos, get_github_token, github_get_all, github_iter, GITHUB_OWNER
 
     token = get_github_token()
     if not token:
@@ -22,7 +23,6 @@ def download_issues():
         console.print("Set it with: export GITHUB_TOKEN='your_token'")
         return
 
-    g = Github(token)
     repos = get_all_repos()
 
     # Filter to repos with issues
@@ -55,49 +55,49 @@ def download_issues():
     # Fetch and save issues
     with console.status(f"[bold green]Fetching issues from {selected_repo.name}..."):
         try:
-            gh_repo = g.get_repo(f"{GITHUB_OWNER}/{selected_repo.name}")
-            issues = list(gh_repo.get_issues(state="open"))
-
-            # Filter out PRs
-            issues = [i for i in issues if not i.pull_request]
+            # Conditional requests: unchanged pages come back as 304 from the on-disk cache
+            repo_path = f"/repos/{GITHUB_OWNER}/{selected_repo.name}"
+            # /issues also returns PRs; filter them out while paging instead of building a second list
+            issues = (
+                i for i in github_iter(f"{repo_path}/issues?state=open&per_page=100", token, refresh)
+                if "pull_request" not in i
+            )
+
+            count = 0
+            for issue in issues:
+                count += 1
+                filename = f"issue_{issue['number']}.txt"
+                filepath = output_dir / filename
 
-            if not issues:
+                # Fetch comments (skip the request when there are none)
+                comments = []
+                if issue["comments"]:
+                    comments = github_get_all(
+                        f"{repo_path}/issues/{issue['number']}/comments?per_page=100", token, refresh
+                    )
+
+                text = format_issue(
+                    number=issue["number"],
+                    title=issue["title"],
+                    url=issue["html_url"],
+                    author=issue["user"]["login"],
+                    created_at=issue["created_at"],
+                    labels=[l["name"] for l in issue["labels"]],
+                    body=issue["body"],
+                    comments=[
+                        {"author": c["user"]["login"], "created_at": c["created_at"], "body": c["body"]}
+                        for c in comments
+                    ],
+                )
+
+                # Write file (one write; explicit UTF-8 so emoji etc. work on Windows)
+                filepath.write_text(text, encoding="utf-8")
+
+            if not count:
                 console.print("[yellow]No open issues found (only PRs).[/yellow]")
                 return
 
-            for issue in issues:
-                filename = f"issue_{issue.number}.txt"
-                filepath = output_dir / filename
-
-                # Build issue content
-                content = []
-                content.append(f"Issue #{issue.number}: {issue.title}")
-                content.append("=" * 60)
-                content.append(f"URL: {issue.html_url}")
-                content.append(f"Author: {issue.user.login}")
-                content.append(f"Created: {issue.created_at.strftime('%Y-%m-%d %H:%M')}")
-                content.append(f"Labels: {', '.join([l.name for l in issue.labels]) or 'None'}")
-                content.append("")
-                content.append("--- Description ---")
-                content.append(issue.body or "(No description)")
-                content.append("")
-
-                # Fetch comments
-                comments = list(issue.get_comments())
-                if comments:
-                    content.append(f"--- Comments ({len(comments)}) ---")
-                    content.append("")
-                    for comment in comments:
-                        content.append(f"[{comment.user.login}] ({comment.created_at.strftime('%Y-%m-%d %H:%M')})")
-                        content.append(comment.body or "(empty)")
-                        content.append("-" * 40)
-                        content.append("")
-
-                # Write file
-                with open(filepath, "w") as f:
-                    f.write("\n".join(content))
-
-            console.print(f"\n[green]Downloaded {len(issues)} issues to:[/green] {output_dir}")
+            console.print(f"\n[green]Downloaded {count} issues to:[/green] {output_dir}")
 
         except Exception as e:
             console.print(f"[red]Error fetching issues: {e}[/red]")
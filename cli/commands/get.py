@@ -1,23 +1,35 @@
 """ComfyUI environment setup from YAML configs."""
 
+import codecs
+import hashlib
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
 import time as _time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import yaml
 from rich.console import Console
 
-from config import UTILS_REPOS_DIR, CT_ENVS_DIR, INSTALL_DIR, get_logger, COMMAND_NAME
+from config import UTILS_REPOS_DIR, CT_ENVS_DIR, INSTALL_DIR, get_logger, load_yaml, COMMAND_NAME
 
 console = Console()
 IS_WINDOWS = platform.system() == "Windows"
 IS_MAC = platform.system() == "Darwin"
 logger = None  # Initialized in setup_comfyui
 
+# Local utils repos installed editable into every env (see clone-utils)
+LOCAL_DEV_PACKAGES = ["comfy-env", "comfy-test", "comfy-3d-viewers", "comfy-attn"]
+
+# Written into isolated _env_* dirs once the local dev packages are installed there
+ISOLATED_ENV_STAMP = ".comfy-dev-cli-stamp"
+
+# An unpinned "torch" line in ComfyUI's requirements.txt (LF or CRLF endings)
+_TORCH_RE = re.compile(rb"^torch(?=\r?$)", re.MULTILINE)
+
 _step_start = 0.0
 _total_start = 0.0
 
@@ -109,19 +121,26 @@ def run_logged(cmd: list, check: bool = True, cwd=None) -> subprocess.CompletedP
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,  # Merge stderr into stdout
-        text=True,
         cwd=cwd,
-        bufsize=1,  # Line buffered
     )
 
-    # Stream output line by line
-    output_lines = []
-    for line in process.stdout:
-        line = line.rstrip()
-        print(line)  # Print to terminal
-        output_lines.append(line)
-        if logger:
-            logger.info(line)
+    # Stream output in raw chunks: one read/write per chunk instead of per line
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    fd = process.stdout.fileno()
+    chunks = []
+    while True:
+        data = os.read(fd, 65536)
+        chunk = decoder.decode(data, final=not data)
+        if chunk:
+            sys.stdout.write(chunk)  # Print to terminal
+            sys.stdout.flush()
+            chunks.append(chunk)
+            if logger and chunk.strip():
+                logger.info(chunk.rstrip())
+        if not data:
+            break
+    process.stdout.close()
+    output_lines = [line.rstrip() for line in "".join(chunks).splitlines()]
 
     process.wait()
 
@@ -132,14 +151,76 @@ def run_logged(cmd: list, check: bool = True, cwd=None) -> subprocess.CompletedP
     return subprocess.CompletedProcess(cmd, process.returncode, "\n".join(output_lines), "")
 
 
+def is_git_repo(path: Path) -> bool:
+    """True if path holds a usable git checkout (not e.g. the leftovers of an interrupted clone)."""
+    if not (Path(path) / ".git").exists():
+        return False
+    result = subprocess.run(
+        ["git", "-C", str(path), "rev-parse", "--git-dir"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+def git_clone_cmd(url: str, target, branch: str | None = None, partial: bool = True) -> list:
+    """Build a shallow clone command; partial clones fetch blobs lazily from GitHub."""
+    cmd = ["git", "clone", "--depth", "1", "--single-branch"]
+    if partial:
+        cmd.append("--filter=blob:none")
+    if branch:
+        cmd.extend(["-b", branch])
+    cmd.extend([url, str(target)])
+    return cmd
+
+
+def is_filter_unsupported(output: str) -> bool:
+    """Whether a failed clone's output says partial clone (--filter) isn't supported."""
+    return "filter" in output.lower()
+
+
+def clone_logged(url: str, target, branch: str | None = None):
+    """Partial shallow clone via run_logged, retrying without --filter for old git/servers."""
+    result = run_logged(git_clone_cmd(url, target, branch), check=False)
+    if result.returncode != 0 and is_filter_unsupported(result.stdout):
+        result = run_logged(git_clone_cmd(url, target, branch, partial=False), check=False)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, result.args)
+    return result
+
+
 # Paths - use ROOT_DIR from config (works regardless of install path)
 from config import ROOT_DIR as _ROOT_DIR
 CONFIG_DIR = _ROOT_DIR / "comfy-dev-cli" / "config" / "setup"
 
 
+def _isolated_envs(custom_nodes_path: Path) -> list[Path]:
+    """The _env_* directories (or symlinks) custom nodes create one level below custom_nodes/."""
+    envs = []
+    with os.scandir(custom_nodes_path) as nodes:
+        for node in nodes:
+            if not node.is_dir():
+                continue
+            with os.scandir(node.path) as entries:
+                envs.extend(
+                    Path(e.path) for e in entries
+                    if e.name.startswith("_env_") and (e.is_dir() or e.is_symlink())
+                )
+    return envs
+
+
+def list_config_names() -> list[str]:
+    """Sorted names of the setup configs (one scandir, no Path object per entry)."""
+    with os.scandir(CONFIG_DIR) as it:
+        return sorted(
+            e.name[:-4] for e in it
+            if e.name.endswith(".yml") and e.is_file(follow_symlinks=False)
+        )
+
+
 def list_configs():
     """List available ComfyUI configs."""
-    configs = sorted([f.stem for f in CONFIG_DIR.glob("*.yml")])
+    configs = list_config_names()
     console.print("[bold]Available configs:[/bold]")
     for name in configs:
         console.print(f"  [cyan]{name}[/cyan]")
@@ -158,12 +239,10 @@ def setup_comfyui(config_name: str, reinstall: bool = False):
 
     if not config_file.exists():
         console.print(f"[red]Error: Config file not found: {config_file}[/red]")
-        available = [f.stem for f in CONFIG_DIR.glob("*.yml")]
-        console.print(f"Available configs: {', '.join(sorted(available))}")
+        console.print(f"Available configs: {', '.join(list_config_names())}")
         raise SystemExit(1)
 
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(config_file)
 
     folder_name = config["folder_name"]
     env_name = config["conda_env_name"]  # Keep using this field name for compatibility
@@ -172,10 +251,8 @@ def setup_comfyui(config_name: str, reinstall: bool = False):
     install_path = INSTALL_DIR / folder_name
     comfyui_path = install_path / "ComfyUI"
 
-    # Check uv is available
-    try:
-        subprocess.run(["uv", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check uv is available (PATH lookup only, no process launch)
+    if shutil.which("uv") is None:
         console.print("[red]Error: uv not found. Install with: curl -LsSf https://astral.sh/uv/install.sh | sh[/red]")
         raise SystemExit(1)
 
@@ -197,31 +274,28 @@ def setup_comfyui(config_name: str, reinstall: bool = False):
     console.print(f"Setting up ComfyUI in [cyan]{install_path}[/cyan] with venv [cyan]{env_name}[/cyan]")
 
     # Create directory and clone repos
+    # Explicit absolute targets: the process cwd is never changed, so this is safe to call from threads
     install_path.mkdir(parents=True, exist_ok=True)
-    os.chdir(install_path)
 
     if not comfyui_path.exists():
         _tick("Cloning ComfyUI...")
-        run_logged(["git", "clone", "--depth", "1", "https://github.com/comfyanonymous/ComfyUI.git"])
+        clone_logged("https://github.com/comfyanonymous/ComfyUI.git", comfyui_path)
 
     custom_nodes_path = comfyui_path / "custom_nodes"
     custom_nodes_path.mkdir(parents=True, exist_ok=True)
     manager_path = custom_nodes_path / "ComfyUI-Manager"
     if not manager_path.exists():
         _tick("Cloning ComfyUI-Manager...")
-        os.chdir(custom_nodes_path)
-        run_logged(["git", "clone", "--depth", "1", "https://github.com/Comfy-Org/ComfyUI-Manager.git"])
-
-    os.chdir(comfyui_path)
+        clone_logged("https://github.com/Comfy-Org/ComfyUI-Manager.git", manager_path)
 
     # Pin torch version in requirements.txt
     requirements_file = comfyui_path / "requirements.txt"
     if requirements_file.exists():
-        content = requirements_file.read_text()
-        if "\ntorch\n" in content or content.startswith("torch\n"):
+        data = requirements_file.read_bytes()
+        pinned = _TORCH_RE.sub(b"torch==2.8.0", data)
+        if pinned != data:
             console.print("Pinning torch version to 2.8.0...")
-            content = content.replace("\ntorch\n", "\ntorch==2.8.0\n").replace("torch\n", "torch==2.8.0\n", 1)
-            requirements_file.write_text(content)
+            requirements_file.write_bytes(pinned)
 
     # Create virtual environment with uv
     CT_ENVS_DIR.mkdir(parents=True, exist_ok=True)
@@ -251,37 +325,32 @@ def setup_comfyui(config_name: str, reinstall: bool = False):
             "--python", str(env_python)
         ])
 
-    # Install ComfyUI-Manager requirements
+    # Install ComfyUI + ComfyUI-Manager requirements in one resolve (torch already installed with CUDA)
+    req_args = ["-r", str(requirements_file)]
     manager_reqs = manager_path / "requirements.txt"
     if manager_reqs.exists():
-        _tick("Installing ComfyUI-Manager requirements...")
-        run_logged(["uv", "pip", "install", "-r", str(manager_reqs), "--python", str(env_python)])
-
-    # Install ComfyUI requirements (torch already installed with CUDA)
-    _tick("Installing ComfyUI requirements...")
-    run_logged(["uv", "pip", "install", "-r", str(requirements_file), "--python", str(env_python)])
+        req_args.extend(["-r", str(manager_reqs)])
+    _tick("Installing ComfyUI + ComfyUI-Manager requirements...")
+    run_logged(["uv", "pip", "install", *req_args, "--python", str(env_python)])
 
     # Install local dev packages EARLY (so install.py uses local version with fixes)
     _tick("Installing local dev packages (early)...")
     utils_dir = UTILS_REPOS_DIR
-    for pkg in ["comfy-env", "comfy-test", "comfy-3d-viewers", "comfy-attn"]:
-        pkg_path = utils_dir / pkg
-        if pkg_path.exists():
-            run_logged(["uv", "pip", "install", "-e", str(pkg_path), "--python", str(env_python)])
+    dev_pkgs = [(pkg, utils_dir / pkg) for pkg in LOCAL_DEV_PACKAGES if (utils_dir / pkg).exists()]
+    # One install for all packages: uv starts and resolves once instead of per package
+    editable_args = [arg for _, pkg_path in dev_pkgs for arg in ("-e", str(pkg_path))]
+    if editable_args:
+        run_logged(["uv", "pip", "install", *editable_args, "--python", str(env_python)])
 
     # Create constraints file to protect local packages from being overwritten
     constraints_file = env_path / "constraints.txt"
-    constraints = []
-    for pkg in ["comfy-env", "comfy-test", "comfy-3d-viewers", "comfy-attn"]:
-        pkg_path = utils_dir / pkg
-        if pkg_path.exists():
-            constraints.append(f"{pkg} @ file://{pkg_path}")
+    constraints = [f"{pkg} @ file://{pkg_path}" for pkg, pkg_path in dev_pkgs]
     if constraints:
         constraints_file.write_text("\n".join(constraints) + "\n")
         console.print(f"[dim]Created constraints file: {constraints_file}[/dim]")
 
-    # Install custom nodes
-    _tick("Installing custom nodes...")
+    # Parse node entries
+    nodes = []
     for node in nodes_to_install:
         if isinstance(node, dict):
             url = node.get("url", "")
@@ -294,19 +363,32 @@ def setup_comfyui(config_name: str, reinstall: bool = False):
             continue
 
         name = url.rstrip("/").split("/")[-1].replace(".git", "")
-        target = custom_nodes_path / name
-
-        branch_info = f" (branch: {branch})" if branch else ""
-        _tick(f"  Node: {name}{branch_info}")
+        nodes.append((name, url, branch, custom_nodes_path / name))
 
+    # Clone custom nodes in parallel (network-bound and independent of each other)
+    _tick("Cloning custom nodes...")
+    to_clone = []
+    for name, url, branch, target in nodes:
         if target.exists():
-            console.print(f"    [yellow]Already exists, skipping clone[/yellow]")
+            console.print(f"    [yellow]{name}: already exists, skipping clone[/yellow]")
         else:
-            clone_cmd = ["git", "clone", "--depth", "1"]
-            if branch:
-                clone_cmd.extend(["-b", branch])
-            clone_cmd.extend([url, str(target)])
-            run_logged(clone_cmd)
+            to_clone.append((name, url, branch, target))
+
+    if to_clone:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(clone_logged, url, target, branch): name
+                for name, url, branch, target in to_clone
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                console.print(f"    [green]Cloned {futures[future]}[/green] ({done}/{len(futures)})")
+
+    # Install custom nodes serially (they all install into the same venv)
+    _tick("Installing custom nodes...")
+    for name, url, branch, target in nodes:
+        branch_info = f" (branch: {branch})" if branch else ""
+        _tick(f"  Node: {name}{branch_info}")
 
         # Install requirements first (provides dependencies for install.py)
         # Use constraints file to prevent local packages from being overwritten
@@ -322,27 +404,38 @@ def setup_comfyui(config_name: str, reinstall: bool = False):
         if install_script.exists():
             run_logged([str(env_python), str(install_script)], check=False, cwd=target)
 
-    # Also install in any isolated _env_* environments created by custom nodes
-    for env_dir in custom_nodes_path.glob("*/_env_*"):
-        if env_dir.is_dir() or env_dir.is_symlink():
-            # Find pip in the isolated env
-            isolated_pip = env_dir / "bin" / "pip"
-            if not isolated_pip.exists():
-                isolated_pip = env_dir / "Scripts" / "pip.exe"  # Windows
-            if isolated_pip.exists():
-                console.print(f"  Installing in isolated env: [cyan]{env_dir.name}[/cyan]")
-                for pkg in ["comfy-env", "comfy-test", "comfy-3d-viewers", "comfy-attn"]:
-                    pkg_path = utils_dir / pkg
-                    if pkg_path.exists():
-                        run_logged([str(isolated_pip), "install", "-e", str(pkg_path)], check=False)
+    # Also install in any isolated _env_* environments created by custom nodes,
+    # skipping envs whose stamp shows the same local packages are already installed
+    dev_stamp = hashlib.sha256(
+        "\n".join(f"{pkg_path}:{pkg_path.stat().st_mtime_ns}" for _, pkg_path in dev_pkgs).encode()
+    ).hexdigest()
+    for env_dir in _isolated_envs(custom_nodes_path):
+        if not editable_args:
+            break
+        stamp_file = env_dir / ISOLATED_ENV_STAMP
+        if stamp_file.exists() and stamp_file.read_text().strip() == dev_stamp:
+            continue
+        # Find pip in the isolated env
+        isolated_pip = env_dir / "bin" / "pip"
+        if not isolated_pip.exists():
+            isolated_pip = env_dir / "Scripts" / "pip.exe"  # Windows
+        if isolated_pip.exists():
+            console.print(f"  Installing in isolated env: [cyan]{env_dir.name}[/cyan]")
+            result = run_logged([str(isolated_pip), "install", *editable_args], check=False)
+            ok = result.returncode == 0
+            if not ok:
+                # One broken package fails the whole batch; install the rest one by one
+                ok = True
+                for _, pkg_path in dev_pkgs:
+                    if run_logged([str(isolated_pip), "install", "-e", str(pkg_path)], check=False).returncode != 0:
+                        ok = False
+            if ok:
+                stamp_file.write_text(dev_stamp)
 
     # Install local dev packages LAST (to override any versions from custom node requirements)
     _tick("Installing local dev packages (final)...")
-    utils_dir = UTILS_REPOS_DIR
-    for pkg in ["comfy-env", "comfy-test", "comfy-3d-viewers", "comfy-attn"]:
-        pkg_path = utils_dir / pkg
-        if pkg_path.exists():
-            run_logged(["uv", "pip", "install", "-e", str(pkg_path), "--python", str(env_python)])
+    if editable_args:
+        run_logged(["uv", "pip", "install", *editable_args, "--python", str(env_python)])
 
     _done()
     console.print(f"[green]Done![/green] Run with: [cyan]{COMMAND_NAME} start {env_name}[/cyan]")
@@ -1,9 +1,15 @@
 """Audit licenses across all repos."""
 
 import os
+import shutil
 import subprocess
 import tempfile
+import time
 import concurrent.futures
+import functools
+import hashlib
+import json
+import re
 from pathlib import Path
 
 from rich.console import Console
@@ -12,16 +18,49 @@ from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from config import GITHUB_OWNER
+from config import GITHUB_OWNER, COMMAND_CENTER_DIR
 
 console = Console()
 
+# Bounded walk for nested license files: max matches reported, dirs never descended into
+MAX_OTHER_LICENSES = 10
+_LICENSE_SCAN_SKIP_DIRS = {"node_modules", "__pycache__", ".venv", "venv"}
+
+# Sparse checkout for the audit clone (gitignore syntax, later patterns win)
+LICENSE_SCAN_SPARSE_PATTERNS = ["/*", "!/*/", "/*/*", "!/*/*/", "*LICENSE*"]
+
+# README "## License" section, and the status line of the model's answer
+README_SCAN_LIMIT = 200_000
+_README_LICENSE_RE = re.compile(
+    r'(?:^|\n)(#{1,3}\s*(?:License|Licensing).*?)(?=\n#{1,3}\s|\Z)', re.IGNORECASE | re.DOTALL
+)
+_STATUS_RE = re.compile(r'status[:\s*]+\*{0,2}(OK|NEEDS_ATTENTION|CRITICAL)', re.IGNORECASE)
+
+# Deep-audit results keyed by repo HEAD + model + prompt, so unchanged repos skip clone and API call
+LICENSE_AUDIT_CACHE_DIR = COMMAND_CENTER_DIR / "license_audit_cache"
+
 # DeepSeek model on OpenRouter - good balance of cost/quality
 OPENROUTER_MODEL = "deepseek/deepseek-chat"
+OPENROUTER_ATTEMPTS = 3
+
+# Static instructions go in the system message so every repo's request shares the same
+# prefix, which the provider's automatic prompt caching can reuse; only the user message varies
+DEEP_ANALYSIS_SYSTEM_PROMPT = '''You are a software license compliance expert. You will be given a repository's license-related files and analyze its license situation.
+
+Provide a concise analysis covering:
+
+1. **Main License**: What license covers the wrapper/main code?
+2. **Vendored Code**: List any vendored/third-party code and their licenses
+3. **Compatibility Issues**: Any license conflicts? (e.g., GPL wrapper around non-commercial code)
+4. **Missing Info**: Is it clear what the license covers? Any ambiguity?
+5. **Recommendations**: Specific actionable fixes needed (if any)
 
-DEEP_ANALYSIS_PROMPT = '''You are a software license compliance expert. Analyze this repository's license situation.
+Respond with strict JSON only, in this shape:
+{"status": "OK" | "NEEDS_ATTENTION" | "CRITICAL", "main_license": "<license>", "vendored_code": ["<path: license>", ...], "issues": ["...", ...], "action_items": ["...", ...]}
 
-## Repository: {repo_name}
+Use empty lists where there is nothing to report. Be concise. Focus on actionable issues only.'''
+
+DEEP_ANALYSIS_PROMPT = '''## Repository: {repo_name}
 
 ## Files Found:
 {file_tree}
@@ -36,38 +75,37 @@ DEEP_ANALYSIS_PROMPT = '''You are a software license compliance expert. Analyze
 {readme_license_section}
 
 ## Vendor/third-party directories:
-{vendor_dirs}
+{vendor_dirs}'''
 
----
 
-Provide a concise analysis covering:
+def _fetch_license(repo_name: str, token: str) -> dict:
+    """Fetch one repo's detected license (one conditional REST request). Used by thread pool.
 
-1. **Main License**: What license covers the wrapper/main code?
-2. **Vendored Code**: List any vendored/third-party code and their licenses
-3. **Compatibility Issues**: Any license conflicts? (e.g., GPL wrapper around non-commercial code)
-4. **Missing Info**: Is it clear what the license covers? Any ambiguity?
-5. **Recommendations**: Specific actionable fixes needed (if any)
+    The repo endpoint carries license {name, spdx_id} without the license
+    text that /license returns base64-encoded.
+    """
+    from config import github_get
 
-Use this format:
-- Status: OK | NEEDS_ATTENTION | CRITICAL
-- Main License: <license>
-- Issues: <bullet list or "None">
-- Action Items: <bullet list or "None">
+    try:
+        data, _ = github_get(f"/repos/{GITHUB_OWNER}/{repo_name}", token)
+    except Exception:
+        return {"repo": repo_name, "name": "Unknown", "spdx_id": "-", "status": "Error", "status_style": "yellow"}
 
-Be concise. Focus on actionable issues only.'''
+    lic = data.get("license")
+    if not lic:
+        return {"repo": repo_name, "name": "None", "spdx_id": "-", "status": "Missing", "status_style": "red"}
+    return {"repo": repo_name, "name": lic["name"], "spdx_id": lic["spdx_id"], "status": "OK", "status_style": "green"}
 
 
-def audit_licenses(repo_name: str | None):
+def audit_licenses(repo_name: str | None, workers: int = 8):
     """Audit licenses for managed repos."""
-    from github import Github
-    from config import get_all_repos, get_github_token, GITHUB_OWNER
+    from config import get_all_repos, get_github_token
 
     token = get_github_token()
     if not token:
         console.print("[red]GITHUB_TOKEN environment variable not set.[/red]")
         return
 
-    g = Github(token)
     repos = get_all_repos()
 
     if repo_name:
@@ -79,40 +117,9 @@ def audit_licenses(repo_name: str | None):
     table.add_column("SPDX ID", style="green")
     table.add_column("Status", style="bold")
 
-    results = []
-
     with console.status("[bold green]Checking licenses..."):
-        for repo in repos:
-            try:
-                gh_repo = g.get_repo(f"{GITHUB_OWNER}/{repo.name}")
-                license_info = gh_repo.get_license()
-
-                if license_info and license_info.license:
-                    lic = license_info.license
-                    results.append({
-                        "repo": repo.name,
-                        "name": lic.name,
-                        "spdx_id": lic.spdx_id,
-                        "status": "OK",
-                        "status_style": "green",
-                    })
-                else:
-                    results.append({
-                        "repo": repo.name,
-                        "name": "None",
-                        "spdx_id": "-",
-                        "status": "Missing",
-                        "status_style": "red",
-                    })
-
-            except Exception as e:
-                results.append({
-                    "repo": repo.name,
-                    "name": "Unknown",
-                    "spdx_id": "-",
-                    "status": "Error",
-                    "status_style": "yellow",
-                })
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda r: _fetch_license(r.name, token), repos))
 
     # Sort: missing first, then by license name
     results.sort(key=lambda x: (x["status"] != "Missing", x["name"]))
@@ -163,16 +170,76 @@ def _get_openrouter_token():
 
 
 def _clone_repo(repo_url: str, target_dir: Path) -> bool:
-    """Clone a repo to target directory."""
-    try:
-        subprocess.run(
-            ["git", "clone", "--depth", "1", repo_url, str(target_dir)],
-            capture_output=True,
-            check=True,
+    """Clone just the files the license scan reads; full shallow clone as fallback.
+
+    Partial + sparse clone: top-level files, second-level files (package
+    __init__.py, vendor dir contents) and *LICENSE* at any depth, so large
+    model/data files deeper in the tree are never downloaded.
+    """
+    from commands.get import git_clone_cmd, is_filter_unsupported
+
+    sparse_cmd = git_clone_cmd(repo_url, target_dir)
+    sparse_cmd.insert(2, "--sparse")
+    result = subprocess.run(sparse_cmd, capture_output=True, text=True)
+    if result.returncode == 0:
+        result = subprocess.run(
+            ["git", "-C", str(target_dir), "sparse-checkout", "set", "--no-cone", *LICENSE_SCAN_SPARSE_PATTERNS],
+            capture_output=True, text=True,
         )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+        if result.returncode == 0:
+            return True
+    shutil.rmtree(target_dir, ignore_errors=True)
+
+    result = subprocess.run(git_clone_cmd(repo_url, target_dir), capture_output=True, text=True)
+    if result.returncode != 0 and is_filter_unsupported(result.stderr):
+        result = subprocess.run(git_clone_cmd(repo_url, target_dir, partial=False), capture_output=True, text=True)
+    return result.returncode == 0
+
+
+def _read_prefix(path: Path, n_bytes: int) -> str:
+    """Decode only the first n_bytes of a file (large READMEs/licenses are never fully loaded)."""
+    with open(path, "rb") as f:
+        return f.read(n_bytes).decode("utf-8", errors="ignore")
+
+
+def _iter_license_files(root: Path, max_depth: int = 3):
+    """Yield *LICENSE* files within max_depth levels, skipping VCS/env/dependency dirs."""
+    stack = [(str(root), 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith(".git") or entry.name in _LICENSE_SCAN_SKIP_DIRS:
+                continue
+            if "LICENSE" in entry.name and entry.is_file():
+                yield Path(entry.path)
+            elif depth < max_depth and entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, depth + 1))
+        # Reversed so the DFS visits subdirectories in name order
+        stack.extend(reversed(subdirs))
+
+
+def _list_tree_dir(repo_dir: Path, entry: os.DirEntry) -> list[str]:
+    """Sorted names in a top-level directory as committed at HEAD.
+
+    The sparse audit clone leaves subdirectories without a LICENSE unchecked out,
+    so the tree is read from git; falls back to the working copy for non-git dirs.
+    """
+    result = subprocess.run(
+        ["git", "ls-tree", "-z", "--name-only", "HEAD", f"{entry.name}/"],
+        cwd=repo_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode == 0 and result.stdout:
+        return sorted(path.rsplit("/", 1)[-1] for path in result.stdout.split("\0") if path)
+    with os.scandir(entry.path) as it:
+        return sorted(e.name for e in it)
 
 
 def _scan_repo_licenses(repo_dir: Path) -> dict:
@@ -185,118 +252,188 @@ def _scan_repo_licenses(repo_dir: Path) -> dict:
         "vendor_dirs": [],
     }
 
+    # One listing of the top level, reused for the file tree, root LICENSE/README and vendor checks below
+    with os.scandir(repo_dir) as it:
+        top_level = sorted(it, key=lambda e: e.name)
+
     # Get top-level file tree
     files = []
-    for item in sorted(repo_dir.iterdir()):
+    for item in top_level:
         if item.name.startswith(".git"):
             continue
         prefix = "📁 " if item.is_dir() else "📄 "
         files.append(f"{prefix}{item.name}")
     result["file_tree"] = "\n".join(files[:30])  # Limit to 30 items
 
-    # Read root LICENSE file
-    license_file = repo_dir / "LICENSE"
-    if not license_file.exists():
-        license_file = repo_dir / "LICENSE.md"
-    if not license_file.exists():
-        license_file = repo_dir / "LICENSE.txt"
-
-    if license_file.exists():
-        content = license_file.read_text(errors="ignore")
+    # Read root LICENSE file (picked from the top-level listing, no per-name stat)
+    top_files = {e.name for e in top_level if e.is_file()}
+    license_file = None
+    for name in ("LICENSE", "LICENSE.md", "LICENSE.txt"):
+        if name in top_files:
+            license_file = repo_dir / name
+            break
+
+    if license_file:
+        # 4x headroom so a multi-byte prefix still yields the 2000 characters shown
+        content = _read_prefix(license_file, 8000)
         # Truncate if too long, keep header
         if len(content) > 2000:
             content = content[:2000] + "\n... (truncated)"
         result["license_content"] = content
 
-    # Find other license files
-    for license_path in repo_dir.rglob("*LICENSE*"):
+    # Find other license files (snippets for the first few, a count for the rest)
+    more_licenses = 0
+    for license_path in _iter_license_files(repo_dir):
         if license_path == license_file:
             continue
-        if ".git" in str(license_path):
+        if len(result["other_licenses"]) >= MAX_OTHER_LICENSES:
+            more_licenses += 1
             continue
         rel_path = license_path.relative_to(repo_dir)
         try:
-            content = license_path.read_text(errors="ignore")[:500]
+            content = _read_prefix(license_path, 600)[:500]
             result["other_licenses"].append(f"### {rel_path}\n{content}...")
         except:
             result["other_licenses"].append(f"### {rel_path}\n(could not read)")
 
+    if more_licenses:
+        result["other_licenses"].append(f"... and {more_licenses} more license files")
     result["other_licenses"] = "\n\n".join(result["other_licenses"]) or "None found"
 
     # Extract license section from README
     readme_file = repo_dir / "README.md"
-    if readme_file.exists():
-        readme_content = readme_file.read_text(errors="ignore")
+    if "README.md" in top_files:
+        # Capped so a huge README can't make the lazy .*? scan expensive
+        readme_content = _read_prefix(readme_file, README_SCAN_LIMIT)
         # Find license section
-        import re
-        match = re.search(
-            r'(?:^|\n)(#{1,3}\s*(?:License|Licensing).*?)(?=\n#{1,3}\s|\Z)',
-            readme_content,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = _README_LICENSE_RE.search(readme_content)
         if match:
             section = match.group(1).strip()
             if len(section) > 1000:
                 section = section[:1000] + "..."
             result["readme_license_section"] = section
 
-    # Find vendor/third-party directories
+    # Find vendor/third-party directories and packages that may be vendored code
     vendor_patterns = ["vendor", "third_party", "external", "lib", "deps"]
-    for pattern in vendor_patterns:
-        for vendor_path in repo_dir.glob(f"*{pattern}*"):
-            if vendor_path.is_dir() and ".git" not in str(vendor_path):
-                # List contents
-                contents = [f.name for f in sorted(vendor_path.iterdir())[:10]]
-                result["vendor_dirs"].append(f"- {vendor_path.name}/: {', '.join(contents)}")
+    package_dirs = []
+    for entry in top_level:
+        if not entry.is_dir() or entry.name.startswith(".git"):
+            continue
+        if any(pattern in entry.name for pattern in vendor_patterns):
+            contents = _list_tree_dir(repo_dir, entry)[:10]
+            result["vendor_dirs"].append(f"- {entry.name}/: {', '.join(contents)}")
+        elif os.path.exists(os.path.join(entry.path, "__init__.py")):
+            package_dirs.append(entry.name)
 
     # Also check for common vendored code patterns (directories with __init__.py that aren't nodes/)
-    for py_dir in repo_dir.iterdir():
-        if py_dir.is_dir() and (py_dir / "__init__.py").exists():
-            if py_dir.name not in ["nodes", "tests", "utils", "web", "docs", "assets"]:
-                if py_dir.name not in [v.split("/")[0].replace("- ", "") for v in result["vendor_dirs"]]:
-                    result["vendor_dirs"].append(f"- {py_dir.name}/ (potential vendored code)")
+    for name in package_dirs:
+        if name not in ["nodes", "tests", "utils", "web", "docs", "assets"]:
+            result["vendor_dirs"].append(f"- {name}/ (potential vendored code)")
 
     result["vendor_dirs"] = "\n".join(result["vendor_dirs"]) or "None detected"
 
     return result
 
 
-def _call_openrouter(prompt: str, api_key: str) -> str:
-    """Call OpenRouter API with the given prompt."""
-    import urllib.request
-    import json
-
-    data = json.dumps({
-        "model": OPENROUTER_MODEL,
-        "messages": [{"role": "user", "content": prompt}],
-        "max_tokens": 1000,
-    }).encode("utf-8")
-
-    req = urllib.request.Request(
-        "https://openrouter.ai/api/v1/chat/completions",
-        data=data,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": f"https://github.com/{GITHUB_OWNER}/coding-scripts",
-        },
-    )
+@functools.cache
+def _openrouter_client():
+    """Shared HTTP client so concurrent audits reuse pooled keep-alive connections."""
+    import httpx
 
-    try:
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode("utf-8"))
-            return result["choices"][0]["message"]["content"]
-    except Exception as e:
-        return f"Error calling API: {e}"
+    return httpx.Client(timeout=60, limits=httpx.Limits(max_connections=16))
+
+
+def _call_openrouter(prompt: str, api_key: str, system: str | None = None, json_mode: bool = False) -> str:
+    """Call OpenRouter API with the given prompt (3 attempts, exponential backoff)."""
+    import httpx
+
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+    body = {"model": OPENROUTER_MODEL, "messages": messages, "max_tokens": 1000}
+    if json_mode:
+        body["response_format"] = {"type": "json_object"}
+
+    for attempt in range(OPENROUTER_ATTEMPTS):
+        try:
+            response = _openrouter_client().post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                json=body,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "HTTP-Referer": f"https://github.com/{GITHUB_OWNER}/coding-scripts",
+                },
+            )
+            # Rate limits and server errors are worth retrying; other errors are not
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if retryable and attempt < OPENROUTER_ATTEMPTS - 1:
+                time.sleep(2 ** (attempt + 1))
+                continue
+            response.raise_for_status()
+            return response.json()["choices"][0]["message"]["content"]
+        except httpx.TransportError as e:
+            if attempt < OPENROUTER_ATTEMPTS - 1:
+                time.sleep(2 ** (attempt + 1))
+                continue
+            return f"Error calling API: {e}"
+        except Exception as e:
+            return f"Error calling API: {e}"
+
+
+def _remote_head_sha(repo_url: str) -> str | None:
+    """HEAD commit of a remote repo without cloning it (git ls-remote)."""
+    result = subprocess.run(["git", "ls-remote", repo_url, "HEAD"], capture_output=True, text=True)
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.split()[0]
+
+
+def _audit_cache_file(repo_name: str, sha: str) -> Path:
+    key = hashlib.blake2b(
+        f"{repo_name}\0{sha}\0{OPENROUTER_MODEL}\0{DEEP_ANALYSIS_SYSTEM_PROMPT}\0{DEEP_ANALYSIS_PROMPT}".encode(), digest_size=16
+    ).hexdigest()
+    # One subdirectory per repo, so clearing stale results never touches another repo's
+    return LICENSE_AUDIT_CACHE_DIR / repo_name / f"{key}.json"
+
+
+def _save_audit_result(cache_file: Path, result: dict):
+    """Write a result atomically, dropping results cached for older HEADs."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    for stale in cache_file.parent.glob("*.json"):
+        stale.unlink(missing_ok=True)
+    tmp = cache_file.with_suffix(".tmp")
+    tmp.write_text(json.dumps(result), encoding="utf-8")
+    os.replace(tmp, cache_file)
+
+
+def _analysis_markdown(answer: dict, status: str) -> str:
+    """Render the model's JSON answer as the markdown shown in the result panel."""
+    def bullets(items) -> str:
+        if not items:
+            return " None"
+        return "".join(f"\n  - {item}" for item in items)
+
+    return (
+        f"- **Status:** {status}\n"
+        f"- **Main License:** {answer.get('main_license') or 'Unknown'}\n"
+        f"- **Vendored Code:**{bullets(answer.get('vendored_code'))}\n"
+        f"- **Issues:**{bullets(answer.get('issues'))}\n"
+        f"- **Action Items:**{bullets(answer.get('action_items'))}"
+    )
 
 
-def _analyze_single_repo(repo, api_key: str, work_dir: Path) -> dict:
-    """Analyze a single repo and return results."""
+def _analyze_single_repo(repo, api_key: str, work_dir: Path, use_cache: bool = True) -> dict:
+    """Analyze a single repo and return results (cached per HEAD commit)."""
     from config import GITHUB_OWNER
 
     repo_dir = work_dir / repo.name
     repo_url = f"https://github.com/{GITHUB_OWNER}/{repo.name}.git"
 
+    sha = _remote_head_sha(repo_url)
+    cache_file = _audit_cache_file(repo.name, sha) if sha else None
+    if use_cache and cache_file and cache_file.exists():
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+
     # Clone
     if not _clone_repo(repo_url, repo_dir):
         return {"repo": repo.name, "status": "ERROR", "analysis": "Failed to clone"}
@@ -315,20 +452,29 @@ def _analyze_single_repo(repo, api_key: str, work_dir: Path) -> dict:
     )
 
     # Call AI
-    analysis = _call_openrouter(prompt, api_key)
+    analysis = _call_openrouter(prompt, api_key, system=DEEP_ANALYSIS_SYSTEM_PROMPT, json_mode=True)
 
-    # Extract status from response (handle various formats)
-    # Look for "Status: X" pattern more carefully
-    import re
+    # Structured answer first; fall back to finding "Status: X" in free text
     status = "UNKNOWN"
-    status_match = re.search(r'status[:\s*]+\*{0,2}(OK|NEEDS_ATTENTION|CRITICAL)', analysis, re.IGNORECASE)
-    if status_match:
-        status = status_match.group(1).upper()
-
-    return {"repo": repo.name, "status": status, "analysis": analysis}
+    try:
+        answer = json.loads(analysis)
+        status = str(answer.get("status", "")).upper()
+        if status not in ("OK", "NEEDS_ATTENTION", "CRITICAL"):
+            status = "UNKNOWN"
+        analysis = _analysis_markdown(answer, status)
+    except (ValueError, AttributeError):
+        status_match = _STATUS_RE.search(analysis)
+        if status_match:
+            status = status_match.group(1).upper()
+
+    result = {"repo": repo.name, "status": status, "analysis": analysis}
+    # API failures are not cached so the next run retries them
+    if cache_file and not analysis.startswith("Error calling API"):
+        _save_audit_result(cache_file, result)
+    return result
 
 
-def deep_audit_licenses(repo_name: str | None):
+def deep_audit_licenses(repo_name: str | None, workers: int = 8, use_cache: bool = True):
     """Deep AI-powered license analysis."""
     from config import get_all_repos
 
@@ -359,28 +505,38 @@ def deep_audit_licenses(repo_name: str | None):
             console=console,
         ) as progress:
 
-            # Process repos (could parallelize, but being nice to API)
-            for repo in repos:
-                task = progress.add_task(f"Analyzing {repo.name}...", total=None)
-                result = _analyze_single_repo(repo, api_key, work_dir)
-                results.append(result)
-                progress.remove_task(task)
-
-                # Show result immediately
-                status_color = {
-                    "OK": "green",
-                    "NEEDS_ATTENTION": "yellow",
-                    "CRITICAL": "red",
-                    "ERROR": "red",
-                    "UNKNOWN": "dim",
-                }.get(result["status"], "white")
-
-                console.print(Panel(
-                    Markdown(result["analysis"]),
-                    title=f"[{status_color}]{repo.name}[/{status_color}] - {result['status']}",
-                    border_style=status_color,
-                ))
-                console.print()
+            # Clone + API call per repo are network-bound and independent; results
+            # are rendered here on the main thread as they complete
+            task = progress.add_task(f"Analyzing {len(repos)} repos...", total=len(repos))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_analyze_single_repo, repo, api_key, work_dir, use_cache): repo
+                    for repo in repos
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    repo = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"repo": repo.name, "status": "ERROR", "analysis": f"Analysis failed: {e}"}
+                    results.append(result)
+                    progress.update(task, advance=1, description=f"Analyzed {repo.name}")
+
+                    # Show result immediately
+                    status_color = {
+                        "OK": "green",
+                        "NEEDS_ATTENTION": "yellow",
+                        "CRITICAL": "red",
+                        "ERROR": "red",
+                        "UNKNOWN": "dim",
+                    }.get(result["status"], "white")
+
+                    console.print(Panel(
+                        Markdown(result["analysis"]),
+                        title=f"[{status_color}]{repo.name}[/{status_color}] - {result['status']}",
+                        border_style=status_color,
+                    ))
+                    console.print()
 
     # Summary
     console.print("\n[bold]Summary:[/bold]")
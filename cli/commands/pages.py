@@ -3,7 +3,6 @@
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import httpx
 from rich.console import Console
 from rich.table import Table
 
@@ -12,29 +11,20 @@ from config import get_all_repos, GITHUB_OWNER
 
 def _check_pages(repo_name: str, token: str) -> dict | None:
     """Check if a repo has GitHub Pages enabled. Returns info dict or None."""
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-    }
+    from config import github_get
 
-    # Check the GitHub Pages API endpoint
+    # Check the GitHub Pages API endpoint (conditional request; unchanged sites come back as 304)
     try:
-        resp = httpx.get(
-            f"https://api.github.com/repos/{GITHUB_OWNER}/{repo_name}/pages",
-            headers=headers,
-            timeout=15,
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            return {
-                "name": repo_name,
-                "url": data.get("html_url", f"https://{GITHUB_OWNER}.github.io/{repo_name}/"),
-                "status": data.get("status", "unknown"),
-                "branch": data.get("source", {}).get("branch", "gh-pages"),
-                "path": data.get("source", {}).get("path", "/"),
-                "https_enforced": data.get("https_enforced", False),
-                "custom_domain": data.get("cname") or None,
-            }
+        data, _ = github_get(f"/repos/{GITHUB_OWNER}/{repo_name}/pages", token)
+        return {
+            "name": repo_name,
+            "url": data.get("html_url", f"https://{GITHUB_OWNER}.github.io/{repo_name}/"),
+            "status": data.get("status", "unknown"),
+            "branch": data.get("source", {}).get("branch", "gh-pages"),
+            "path": data.get("source", {}).get("path", "/"),
+            "https_enforced": data.get("https_enforced", False),
+            "custom_domain": data.get("cname") or None,
+        }
     except Exception:
         pass
 
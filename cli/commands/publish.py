@@ -13,10 +13,12 @@ gh-pages structure:
   index.html              <- branch switcher
 """
 
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from rich.console import Console
@@ -63,15 +65,10 @@ def publish_results(repo_name: str, force: bool = False, push: bool = True) -> i
     console.print(f"[dim]Repo: {repo_path}[/dim]")
 
     # 2. Check for uncommitted changes
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
-    )
-    if result.stdout.strip() and not force:
+    status = _git_output(repo_path, "status", "--porcelain")
+    if status.strip() and not force:
         console.print("[red]Uncommitted changes detected![/red]")
-        console.print(result.stdout)
+        console.print(status)
         console.print("[dim]Commit changes first, or use --force to skip this check[/dim]")
         return 1
 
@@ -93,20 +90,107 @@ def publish_results(repo_name: str, force: bool = False, push: bool = True) -> i
 
     for b in branches:
         # Show which platforms have results in this branch
-        platforms_found = [
-            pid for pid in PLATFORM_IDS
-            if (b / pid / "results.json").exists()
-        ]
+        platforms_found = _discover_platforms(b)
         console.print(f"[dim]  Branch: {b.name} -> {', '.join(platforms_found)}[/dim]")
 
     # 5. Publish using worktree
-    return _publish_with_worktree(repo_path, branches, push)
+    remote_url = _git_output(repo_path, "remote", "get-url", "origin").strip()
+    return _publish_with_worktree(repo_path, branches, push, remote_url)
+
+
+def _git_output(repo_path: Path, *args: str) -> str:
+    """Stdout of a read-only git command, or "" if it fails (e.g. no origin remote)."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout if result.returncode == 0 else ""
+
+
+def _discover_platforms(folder: Path) -> list[str]:
+    """Platform subdirs of a branch folder that contain results.json, in PLATFORM_IDS order."""
+    with os.scandir(folder) as it:
+        present = {e.name for e in it if e.name in PLATFORM_IDS and e.is_dir()}
+    return [p for p in PLATFORM_IDS if p in present and os.path.isfile(os.path.join(folder, p, "results.json"))]
+
+
+def _copy_file(src, dst):
+    """copy2, but via copy_file_range on Linux so btrfs/xfs can share extents (reflink).
+
+    Hardlinks are not used: report generation rewrites files in the worktree,
+    which would silently modify the local results too.
+    """
+    if sys.platform != "linux" or not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        if remaining > 0:
+            return shutil.copy2(src, dst)
+    except OSError:
+        # e.g. EXDEV on older kernels or unsupported filesystems
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _fast_copytree(src: Path, dst: Path, max_workers: int | None = None) -> None:
+    """copytree with the file copies spread over a thread pool.
+
+    Directories are created serially while walking src (so every file's
+    parent exists before it is submitted); the per-file _copy_file calls
+    are I/O-bound and run concurrently, which matters for platforms with
+    many screenshots/videos.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    pairs = []
+    dirs = []
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        dirs.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                else:
+                    pairs.append((entry.path, target))
+
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            # list() re-raises the first copy error
+            list(executor.map(lambda p: _copy_file(*p), pairs))
+    # Directory timestamps last, after their contents were written (as copytree does)
+    for src_dir, dst_dir in dirs:
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _copy_one_platform(src_platform: Path, dst_platform: Path, max_workers: int) -> None:
+    """Replace one platform dir in the worktree. Used by thread pool."""
+    # Remove old version of THIS platform only, preserve others
+    try:
+        shutil.rmtree(dst_platform)
+    except FileNotFoundError:
+        pass
+    _fast_copytree(src_platform, dst_platform, max_workers=max_workers)
 
 
 def _publish_with_worktree(
     repo_path: Path,
     branches: list[Path],
     push: bool = True,
+    remote_url: str = "",
 ) -> int:
     """Publish using git worktree to avoid touching the main branch.
 
@@ -117,6 +201,7 @@ def _publish_with_worktree(
         repo_path: Path to the git repository
         branches: List of branch folders containing platform subdirs
         push: If True, push to remote after committing
+        remote_url: URL of origin, used to print the GitHub Pages URL
 
     Returns:
         Exit code (0 for success, 1 for error)
@@ -126,11 +211,7 @@ def _publish_with_worktree(
     # Fetch gh-pages from remote (may only exist on origin, not locally)
     console.print("[dim]Fetching gh-pages from origin...[/dim]")
     # Delete stale local gh-pages branch if it exists (avoids ref conflicts)
-    subprocess.run(
-        ["git", "branch", "-D", "gh-pages"],
-        cwd=repo_path,
-        capture_output=True,
-    )
+    subprocess.run(["git", "branch", "-D", "gh-pages"], cwd=repo_path, capture_output=True)
     fetch_result = subprocess.run(
         ["git", "fetch", "origin", "gh-pages"],
         cwd=repo_path,
@@ -162,9 +243,10 @@ def _publish_with_worktree(
                 # Create new orphan gh-pages branch
                 console.print("[dim]Creating new gh-pages branch...[/dim]")
 
-                # Create worktree with detached HEAD first
+                # Create worktree with detached HEAD first (no checkout: its files
+                # would otherwise be left behind and end up in gh-pages)
                 result = subprocess.run(
-                    ["git", "worktree", "add", "--detach", str(worktree_path)],
+                    ["git", "worktree", "add", "--detach", "--no-checkout", str(worktree_path)],
                     cwd=repo_path,
                     capture_output=True,
                     text=True,
@@ -173,9 +255,10 @@ def _publish_with_worktree(
                     console.print(f"[red]Failed to create worktree: {result.stderr}[/red]")
                     return 1
 
-                # Now create orphan branch inside the worktree
+                # Now create orphan branch inside the worktree; unlike `checkout --orphan`,
+                # `switch --orphan` starts from an empty index, so nothing needs unstaging
                 result = subprocess.run(
-                    ["git", "checkout", "--orphan", "gh-pages"],
+                    ["git", "switch", "--orphan", "gh-pages"],
                     cwd=worktree_path,
                     capture_output=True,
                     text=True,
@@ -184,41 +267,46 @@ def _publish_with_worktree(
                     console.print(f"[red]Failed to create orphan branch: {result.stderr}[/red]")
                     return 1
 
-                # Remove all files from index (orphan branch starts with staged files)
-                subprocess.run(
-                    ["git", "rm", "-rf", "--cached", "."],
-                    cwd=worktree_path,
-                    capture_output=True,
-                )
-
             # --- Merge local results into gh-pages (per-branch, per-platform) ---
             for branch_folder in branches:
                 branch_name = branch_folder.name
                 gh_branch_dir = worktree_path / branch_name
                 gh_branch_dir.mkdir(parents=True, exist_ok=True)
 
-                for platform_id in PLATFORM_IDS:
-                    src_platform = branch_folder / platform_id
-                    if not (src_platform / "results.json").exists():
-                        continue
-
-                    console.print(f"[dim]  Copying {branch_name}/{platform_id}...[/dim]")
-                    dst_platform = gh_branch_dir / platform_id
-
-                    # Remove old version of THIS platform only, preserve others
-                    if dst_platform.exists():
-                        shutil.rmtree(dst_platform)
-                    shutil.copytree(src_platform, dst_platform)
+                # Platform dirs are disjoint subtrees, so copy them concurrently
+                # (progress is printed here on the main thread, not from workers)
+                platform_ids = _discover_platforms(branch_folder)
+                if platform_ids:
+                    file_workers = max(1, min(32, (os.cpu_count() or 1) * 4) // len(platform_ids))
+                    with ThreadPoolExecutor(max_workers=len(platform_ids)) as executor:
+                        futures = []
+                        for platform_id in platform_ids:
+                            console.print(f"[dim]  Copying {branch_name}/{platform_id}...[/dim]")
+                            futures.append(executor.submit(
+                                _copy_one_platform, branch_folder / platform_id,
+                                gh_branch_dir / platform_id, file_workers,
+                            ))
+                        for future in futures:
+                            future.result()
 
                 # Regenerate HTML reports for all platforms in this branch
+                # (includes platforms previously published by CI, not just the ones copied above)
                 if HAS_REPORT_UTILS:
-                    for platform_id in PLATFORM_IDS:
-                        platform_dir = gh_branch_dir / platform_id
-                        if (platform_dir / "results.json").exists():
+                    # Each platform dir is rendered independently, so render them concurrently
+                    platform_ids = _discover_platforms(gh_branch_dir)
+                    with ThreadPoolExecutor(max_workers=max(1, min(4, len(platform_ids)))) as executor:
+                        futures = {
+                            executor.submit(
+                                generate_html_report, gh_branch_dir / platform_id, repo_name,
+                                current_platform=platform_id,
+                            ): platform_id
+                            for platform_id in platform_ids
+                        }
+                        for future in as_completed(futures):
                             try:
-                                generate_html_report(platform_dir, repo_name, current_platform=platform_id)
+                                future.result()
                             except Exception as e:
-                                console.print(f"[yellow]  Warning generating {platform_id} report: {e}[/yellow]")
+                                console.print(f"[yellow]  Warning generating {futures[future]} report: {e}[/yellow]")
 
                     # Regenerate branch index (platform tabs)
                     console.print(f"[dim]  Generating {branch_name} index...[/dim]")
@@ -229,44 +317,40 @@ def _publish_with_worktree(
                 console.print("[dim]Generating root index (branch switcher)...[/dim]")
                 generate_branch_root_index(worktree_path, repo_name)
 
-            # Add .nojekyll file to disable Jekyll processing
-            (worktree_path / ".nojekyll").touch()
+            # Add .nojekyll file to disable Jekyll processing (already there after the first publish)
+            nojekyll = worktree_path / ".nojekyll"
+            if not nojekyll.exists():
+                nojekyll.write_bytes(b"")
 
-            # Stage all changes
-            subprocess.run(
-                ["git", "add", "-A"],
-                cwd=worktree_path,
-                check=True,
-            )
-
-            # Check if there are changes to commit
+            # Stage and commit; `git diff --cached --quiet` exits 0 when nothing is staged
+            console.print("[dim]Committing...[/dim]")
+            subprocess.run(["git", "add", "-A"], cwd=worktree_path, check=True)
+            if subprocess.run(["git", "diff", "--cached", "--quiet"], cwd=worktree_path).returncode == 0:
+                console.print("[yellow]No changes to publish[/yellow]")
+                return 0
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "commit", "--quiet", "-m", "Update test results"],
                 cwd=worktree_path,
                 capture_output=True,
                 text=True,
             )
-            if not result.stdout.strip():
-                console.print("[yellow]No changes to publish[/yellow]")
-                return 0
+            if result.returncode != 0:
+                console.print(f"[red]Failed to commit: {result.stderr or result.stdout}[/red]")
+                return 1
 
-            # Commit
-            console.print("[dim]Committing...[/dim]")
-            subprocess.run(
-                ["git", "commit", "-m", "Update test results"],
-                cwd=worktree_path,
-                check=True,
-                capture_output=True,
-            )
+            if push:
+                console.print("[dim]Pushing to origin/gh-pages...[/dim]")
+                result = subprocess.run(
+                    ["git", "push", "-u", "origin", "gh-pages"],
+                    cwd=worktree_path,
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode != 0:
+                    console.print(f"[red]Failed to push: {result.stderr}[/red]")
+                    return 1
 
-            # Get repo URL for GitHub Pages URL
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
-            remote_url = result.stdout.strip()
+            # GitHub Pages URL from the repo URL
             pages_url = None
 
             if "github.com" in remote_url:
@@ -281,18 +365,6 @@ def _publish_with_worktree(
                     pages_url = f"https://{owner}.github.io/{repo}/"
 
             if push:
-                # Push to remote
-                console.print("[dim]Pushing to origin/gh-pages...[/dim]")
-                result = subprocess.run(
-                    ["git", "push", "-u", "origin", "gh-pages"],
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode != 0:
-                    console.print(f"[red]Failed to push: {result.stderr}[/red]")
-                    return 1
-
                 console.print(f"\n[green bold]Published![/green bold]")
                 if pages_url:
                     console.print(f"[cyan]{pages_url}[/cyan]")
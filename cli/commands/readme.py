@@ -1,16 +1,71 @@
 """Browse full GitHub repo pages for all managed repos via local proxy."""
 
+import hashlib
 import os
 import re
+import time
+from pathlib import Path
 
 import httpx
 from rich.console import Console
 
-from config import get_all_repos, GITHUB_OWNER
+from config import get_all_repos, http2_available, GITHUB_OWNER, COMMAND_CENTER_DIR
+
+# Root-relative href/src/action attributes (not protocol-relative "//host/...")
+_ROOT_RELATIVE_RE = re.compile(rb"""\b(href|src|action)=(["'])/(?!/)""")
+
+# Rewritten pages, served stale-while-revalidate: older than this triggers a background refresh
+PROXY_CACHE_DIR = COMMAND_CENTER_DIR / "readme_proxy_cache"
+PROXY_CACHE_SECONDS = 300
+
+
+def _proxy_cache_file(url: str) -> Path:
+    return PROXY_CACHE_DIR / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.html"
+
+
+def _save_proxy_page(cache_file: Path, html: bytes):
+    """Write a rewritten page atomically."""
+    PROXY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(".tmp")
+    tmp.write_bytes(html)
+    os.replace(tmp, cache_file)
+
+
+def _rewrite(html: bytes) -> bytes:
+    return _ROOT_RELATIVE_RE.sub(rb"\1=\2https://github.com/", html)
+
+
+async def _rewrite_stream(resp: httpx.Response, cache_file: Path | None = None):
+    """Yield the page with root-relative URLs made absolute, chunk by chunk.
+
+    A match never contains whitespace or ">", so each chunk is rewritten up
+    to the last such byte and the remainder is carried into the next one.
+    The full page is saved to cache_file once the stream completes.
+    """
+    tail = b""
+    parts = []
+    try:
+        async for chunk in resp.aiter_bytes():
+            buf = tail + chunk
+            cut = max(buf.rfind(b">"), buf.rfind(b" "), buf.rfind(b"\n")) + 1
+            tail = buf[cut:]
+            if cut:
+                part = _rewrite(buf[:cut])
+                parts.append(part)
+                yield part
+        if tail:
+            part = _rewrite(tail)
+            parts.append(part)
+            yield part
+        if cache_file is not None:
+            _save_proxy_page(cache_file, b"".join(parts))
+    finally:
+        await resp.aclose()
 
 
 def serve_readmes(port: int = 8002, threshold: int = 0):
     """Launch a browse UI that proxies full GitHub repo pages."""
+    import asyncio
     import signal
     import sys
     import webbrowser
@@ -18,9 +73,8 @@ def serve_readmes(port: int = 8002, threshold: int = 0):
     import uvicorn
     from fastapi import FastAPI
     from fastapi.requests import Request
-    from fastapi.responses import HTMLResponse, Response
+    from fastapi.responses import HTMLResponse, StreamingResponse
     from fastapi.templating import Jinja2Templates
-    from pathlib import Path
 
     console = Console()
     token = os.environ.get("GITHUB_TOKEN")
@@ -32,6 +86,7 @@ def serve_readmes(port: int = 8002, threshold: int = 0):
     if threshold > 0:
         repos = [r for r in repos if r.stars >= threshold]
     repo_names = sorted([r.name for r in repos], key=str.lower)
+    repo_name_set = frozenset(repo_names)  # for per-request membership checks
 
     if not repo_names:
         console.print("[yellow]No repos found.[/yellow]")
@@ -39,7 +94,11 @@ def serve_readmes(port: int = 8002, threshold: int = 0):
 
     console.print(f"[green]Loaded {len(repo_names)} repos[/green]")
 
+    # One client for the whole browse session; over HTTP/2 (when h2 is installed)
+    # every proxied page shares a single TLS connection to github.com
     client = httpx.AsyncClient(
+        http2=http2_available(),
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
         timeout=30,
         follow_redirects=True,
         headers={
@@ -65,29 +124,47 @@ def serve_readmes(port: int = 8002, threshold: int = 0):
         """Proxy a GitHub repo page, stripping frame-blocking headers."""
         # Only allow proxying repos we manage
         base_repo = repo_name.split("/")[0]
-        if base_repo not in repo_names:
+        if base_repo not in repo_name_set:
             return HTMLResponse("<h1>Not found</h1>", status_code=404)
 
         url = f"https://github.com/{GITHUB_OWNER}/{repo_name}"
+        cache_file = _proxy_cache_file(url)
         try:
-            resp = await client.get(url)
+            age = time.time() - cache_file.stat().st_mtime
+        except FileNotFoundError:
+            age = None
+        if age is not None:
+            # Serve the cached page; refresh it in the background once it is stale
+            if age > PROXY_CACHE_SECONDS and url not in refreshing:
+                refreshing[url] = asyncio.create_task(_refresh(url, cache_file))
+            return HTMLResponse(cache_file.read_bytes())
+
+        try:
+            resp = await client.send(client.build_request("GET", url), stream=True)
         except Exception as e:
             return HTMLResponse(f"<h1>Error fetching page</h1><p>{e}</p>", status_code=502)
 
         if resp.status_code != 200:
+            await resp.aclose()
             return HTMLResponse(f"<h1>{resp.status_code}</h1>", status_code=resp.status_code)
 
-        html = resp.text
+        # Stream the page through, rewriting relative URLs to absolute GitHub URLs.
+        # GitHub's headers are not forwarded, so there is no X-Frame-Options / CSP
+        # and the iframe works
+        return StreamingResponse(_rewrite_stream(resp, cache_file), media_type="text/html")
 
-        # Rewrite relative URLs to go through our proxy or to absolute GitHub URLs
-        html = html.replace('href="/', f'href="https://github.com/')
-        html = html.replace("href='/", f"href='https://github.com/")
-        html = html.replace('src="/', f'src="https://github.com/')
-        html = html.replace("src='/", f"src='https://github.com/")
-        html = html.replace('action="/', f'action="https://github.com/')
+    # url -> in-flight background refresh (also keeps the task referenced)
+    refreshing: dict[str, asyncio.Task] = {}
 
-        # Return without X-Frame-Options / CSP so iframe works
-        return HTMLResponse(html)
+    async def _refresh(url: str, cache_file: Path):
+        try:
+            resp = await client.get(url)
+            if resp.status_code == 200:
+                _save_proxy_page(cache_file, _rewrite(resp.content))
+        except httpx.HTTPError:
+            pass  # keep serving the stale copy
+        finally:
+            refreshing.pop(url, None)
 
     @browse_app.on_event("shutdown")
     async def shutdown():
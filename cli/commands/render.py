@@ -2,6 +2,7 @@
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import typer
@@ -9,6 +10,13 @@ from rich.console import Console
 
 console = Console()
 
+# orjson parses large workflows (embedded previews) several times faster; stdlib json accepts bytes too
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Try to import PIL, give helpful error if not installed
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -16,6 +24,13 @@ try:
 except ImportError:
     HAS_PIL = False
 
+# Optional: aggdraw (AGG rasterizer) draws anti-aliased sockets; PIL's ellipse is aliased
+try:
+    import aggdraw
+    HAS_AGGDRAW = True
+except ImportError:
+    HAS_AGGDRAW = False
+
 
 # Node styling
 NODE_MIN_WIDTH = 200
@@ -39,6 +54,65 @@ COLORS = {
 }
 
 
+@lru_cache(maxsize=512)
+def _text_width(font, text: str) -> int:
+    """Rendered pixel width of text, memoized (labels repeat across nodes)."""
+    return int(font.getlength(text))
+
+
+@lru_cache(maxsize=512)
+def _fit_text(font, text: str, max_width: int) -> str:
+    """Truncate text with "..." so it renders within max_width pixels."""
+    if _text_width(font, text) <= max_width:
+        return text
+    # Binary search for the longest prefix that fits with the ellipsis
+    lo, hi = 0, len(text) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.getlength(text[:mid] + "...") <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "..."
+
+
+@lru_cache(maxsize=64)
+def _node_template(width: int, height: int, n_inputs: int, n_outputs: int) -> "Image.Image":
+    """Pre-rasterized node body (background, title bar, sockets) without text.
+
+    Sockets overhang the node by SOCKET_RADIUS on each side, so the node's
+    own (0, 0) sits at (SOCKET_RADIUS, 0) in the template. Transparent
+    elsewhere; paste with the template as its own mask.
+    """
+    template = Image.new("RGBA", (width + 2 * SOCKET_RADIUS + 1, height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(template)
+    x = SOCKET_RADIUS
+
+    # Node background with rounded corners (approximate with rectangle)
+    draw.rectangle([x, 0, x + width, height], fill=COLORS["node_bg"], outline=COLORS["node_border"], width=1)
+    # Title bar
+    draw.rectangle([x, 0, x + width, NODE_TITLE_HEIGHT], fill=COLORS["node_title_bg"])
+
+    # Input sockets (left side), output sockets (right side)
+    if HAS_AGGDRAW:
+        # Draws onto a copy of the template; flush() writes it back once
+        agg = aggdraw.Draw(template)
+        pen = aggdraw.Pen(COLORS["node_border"], 1)
+    for count, cx, fill in ((n_inputs, x, COLORS["socket_input"]), (n_outputs, x + width, COLORS["socket_output"])):
+        if HAS_AGGDRAW:
+            brush = aggdraw.Brush(fill)
+        for i in range(count):
+            socket_y = NODE_TITLE_HEIGHT + i * SOCKET_SPACING + SOCKET_SPACING // 2
+            bbox = [cx - SOCKET_RADIUS, socket_y - SOCKET_RADIUS, cx + SOCKET_RADIUS, socket_y + SOCKET_RADIUS]
+            if HAS_AGGDRAW:
+                agg.ellipse(bbox, pen, brush)
+            else:
+                draw.ellipse(bbox, fill=fill, outline=COLORS["node_border"])
+    if HAS_AGGDRAW:
+        agg.flush()
+    return template
+
+
 def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
     """Render a workflow JSON to an image."""
     if not HAS_PIL:
@@ -47,8 +121,7 @@ def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
         raise typer.Exit(1)
 
     # Load workflow
-    with open(workflow_path) as f:
-        workflow = json.load(f)
+    workflow = _json_loads(Path(workflow_path).read_bytes())
 
     nodes = workflow.get("nodes", [])
     links = workflow.get("links", [])
@@ -65,8 +138,10 @@ def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
         font = ImageFont.load_default()
         font_small = font
 
-    # Calculate node sizes based on inputs/outputs
+    # Calculate node sizes based on inputs/outputs, tracking canvas bounds in the same pass
     node_data = {}
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
     for node in nodes:
         node_id = node.get("id")
         inputs = node.get("inputs", [])
@@ -89,15 +164,9 @@ def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
             "inputs": inputs,
             "outputs": outputs,
         }
-
-    # Calculate canvas bounds
-    all_x = [d["pos"][0] for d in node_data.values()]
-    all_y = [d["pos"][1] for d in node_data.values()]
-    all_x_end = [d["pos"][0] + d["size"][0] for d in node_data.values()]
-    all_y_end = [d["pos"][1] + d["size"][1] for d in node_data.values()]
-
-    min_x, max_x = min(all_x), max(all_x_end)
-    min_y, max_y = min(all_y), max(all_y_end)
+        x, y = pos[0], pos[1]
+        min_x, max_x = min(min_x, x), max(max_x, x + width)
+        min_y, max_y = min(min_y, y), max(max_y, y + height)
 
     # Add padding
     canvas_width = int(max_x - min_x + 150)
@@ -109,9 +178,13 @@ def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
     img = Image.new("RGB", (canvas_width, canvas_height), COLORS["background"])
     draw = ImageDraw.Draw(img)
 
-    # Adjust positions with offset
+    # Adjust positions with offset; also precompute each node's socket anchors
+    # (output edge x, first socket y) so the link loop is plain arithmetic
     for node_id, data in node_data.items():
-        data["draw_pos"] = (data["pos"][0] + offset_x, data["pos"][1] + offset_y)
+        draw_x, draw_y = data["pos"][0] + offset_x, data["pos"][1] + offset_y
+        data["draw_pos"] = (draw_x, draw_y)
+        data["out_x"] = draw_x + data["size"][0]
+        data["socket_y0"] = draw_y + NODE_TITLE_HEIGHT + SOCKET_SPACING // 2
 
     # Draw links first (behind nodes)
     # ComfyUI link format: [link_id, src_node_id, src_slot, dst_node_id, dst_slot, type]
@@ -119,20 +192,16 @@ def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
         if len(link) >= 5:
             link_id, src_node_id, src_slot, dst_node_id, dst_slot = link[:5]
 
-            if src_node_id in node_data and dst_node_id in node_data:
-                src_data = node_data[src_node_id]
-                dst_data = node_data[dst_node_id]
-
-                src_pos = src_data["draw_pos"]
-                dst_pos = dst_data["draw_pos"]
-
+            src_data = node_data.get(src_node_id)
+            dst_data = node_data.get(dst_node_id)
+            if src_data is not None and dst_data is not None:
                 # Output socket on right side of source node
-                src_x = src_pos[0] + src_data["size"][0]
-                src_y = src_pos[1] + NODE_TITLE_HEIGHT + src_slot * SOCKET_SPACING + SOCKET_SPACING // 2
+                src_x = src_data["out_x"]
+                src_y = src_data["socket_y0"] + src_slot * SOCKET_SPACING
 
                 # Input socket on left side of destination node
-                dst_x = dst_pos[0]
-                dst_y = dst_pos[1] + NODE_TITLE_HEIGHT + dst_slot * SOCKET_SPACING + SOCKET_SPACING // 2
+                dst_x = dst_data["draw_pos"][0]
+                dst_y = dst_data["socket_y0"] + dst_slot * SOCKET_SPACING
 
                 # Draw bezier-like curve (simple version with midpoint)
                 mid_x = (src_x + dst_x) / 2
@@ -151,53 +220,30 @@ def render_workflow(workflow_path: Path, output_path: Path = None) -> Path:
         width, height = int(data["size"][0]), int(data["size"][1])
         node_type = data["type"]
 
-        # Node background with rounded corners (approximate with rectangle)
-        draw.rectangle(
-            [x, y, x + width, y + height],
-            fill=COLORS["node_bg"],
-            outline=COLORS["node_border"],
-            width=1
-        )
-
-        # Title bar
-        draw.rectangle(
-            [x, y, x + width, y + NODE_TITLE_HEIGHT],
-            fill=COLORS["node_title_bg"]
-        )
-
-        # Node title (truncate if too long)
-        title = node_type if len(node_type) < 25 else node_type[:22] + "..."
+        # Shapes come from a cached template (nodes mostly share sizes); only text is drawn per node
+        template = _node_template(width, height, len(data["inputs"]), len(data["outputs"]))
+        img.paste(template, (x - SOCKET_RADIUS, y), template)
+
+        # Node title (truncate to the node width if too long)
+        title = _fit_text(font, node_type, width - 2 * PADDING)
         draw.text((x + PADDING, y + 7), title, fill=COLORS["text"], font=font)
 
-        # Input sockets (left side) with labels
+        # Input socket labels (left side)
         for i, inp in enumerate(data["inputs"]):
             socket_y = y + NODE_TITLE_HEIGHT + i * SOCKET_SPACING + SOCKET_SPACING // 2
-            draw.ellipse(
-                [x - SOCKET_RADIUS, socket_y - SOCKET_RADIUS,
-                 x + SOCKET_RADIUS, socket_y + SOCKET_RADIUS],
-                fill=COLORS["socket_input"],
-                outline=COLORS["node_border"]
-            )
             # Input label
             label = inp.get("name", "") if isinstance(inp, dict) else ""
             if label:
                 draw.text((x + PADDING, socket_y - 6), label[:15], fill=COLORS["text_dim"], font=font_small)
 
-        # Output sockets (right side) with labels
+        # Output socket labels (right side)
         for i, out in enumerate(data["outputs"]):
             socket_y = y + NODE_TITLE_HEIGHT + i * SOCKET_SPACING + SOCKET_SPACING // 2
-            draw.ellipse(
-                [x + width - SOCKET_RADIUS, socket_y - SOCKET_RADIUS,
-                 x + width + SOCKET_RADIUS, socket_y + SOCKET_RADIUS],
-                fill=COLORS["socket_output"],
-                outline=COLORS["node_border"]
-            )
             # Output label (right-aligned)
             label = out.get("name", "") if isinstance(out, dict) else ""
             if label:
                 label = label[:15]
-                # Approximate right alignment
-                draw.text((x + width - PADDING - len(label) * 5, socket_y - 6), label, fill=COLORS["text_dim"], font=font_small)
+                draw.text((x + width - PADDING - _text_width(font_small, label), socket_y - 6), label, fill=COLORS["text_dim"], font=font_small)
 
     # Determine output path
     if output_path is None:
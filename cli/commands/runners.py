@@ -1,7 +1,8 @@
 """Monitor self-hosted GitHub runners on ROADRUNNER."""
 
-import json
+import os
 import subprocess
+from functools import cache
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -9,7 +10,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-from config import GITHUB_OWNER
+from config import GITHUB_OWNER, get_github_token, github_get
 
 console = Console()
 
@@ -151,9 +152,9 @@ def _parse_ce_envs(raw: str, platform: str) -> list[tuple[str, str, float]]:
     return results
 
 
+@cache
 def _get_roadrunner_creds() -> tuple[str, str, str]:
-    """Get ROADRUNNER SSH credentials from environment."""
-    import os
+    """Get ROADRUNNER SSH credentials from environment (read once per process)."""
     host = os.environ.get("ROADRUNNER_HOST", "")
     user = os.environ.get("ROADRUNNER_USER", "")
     password = os.environ.get("ROADRUNNER_PASS", "")
@@ -163,15 +164,66 @@ def _get_roadrunner_creds() -> tuple[str, str, str]:
     return host, user, password
 
 
-def _ssh_cmd(cmd: str, timeout: int = 10) -> str:
-    """Run a command on ROADRUNNER via SSH."""
+# Idle seconds a background ControlMaster connection stays up after its last use
+SSH_CONTROL_PERSIST = 300
+
+
+@cache
+def _ssh_control_path() -> str:
+    """ControlPath template in a private per-user dir (created on first use)."""
+    control_dir = os.path.expanduser("~/.ssh/controlmasters")
+    os.makedirs(control_dir, mode=0o700, exist_ok=True)
+    return os.path.join(control_dir, "%C")
+
+
+def _ssh_argv(timeout: int, *options: str) -> list[str]:
+    """sshpass/ssh argv up to and including the ROADRUNNER destination.
+
+    All connections share a ControlPath, so once a master is up (see
+    _ssh_start_master) each command rides it instead of doing its own
+    TCP + key exchange + password auth.
+    """
     host, user, password = _get_roadrunner_creds()
+    return [
+        "sshpass", "-p", password, "ssh",
+        "-o", "StrictHostKeyChecking=no",
+        "-o", f"ConnectTimeout={timeout}",
+        # %C is a hash of local host, host, port and user: short enough for sun_path
+        "-o", f"ControlPath={_ssh_control_path()}",
+        *options,
+        f"{user}@{host}",
+    ]
+
+
+def _ssh_start_master(timeout: int = 10):
+    """Start a background ControlMaster to ROADRUNNER unless one is already running.
+
+    Best effort: if it fails, _ssh_cmd just connects directly.
+    """
+    try:
+        check = subprocess.run(
+            _ssh_argv(timeout, "-O", "check"),
+            capture_output=True, timeout=timeout,
+        )
+        if check.returncode == 0:
+            return
+        # -f backgrounds after auth; no pipes, so nothing waits on the daemon's output
+        subprocess.run(
+            _ssh_argv(timeout, "-M", "-N", "-f", "-o", f"ControlPersist={SSH_CONTROL_PERSIST}"),
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=timeout + 5,
+        )
+    except Exception:
+        pass
+
+
+def _ssh_cmd(cmd: str, timeout: int = 10) -> str:
+    """Run a command on ROADRUNNER via SSH (over the ControlMaster connection if one is up)."""
     try:
         result = subprocess.run(
-            ["sshpass", "-p", password, "ssh",
-             "-o", "StrictHostKeyChecking=no",
-             "-o", f"ConnectTimeout={timeout}",
-             f"{user}@{host}", cmd],
+            # ControlMaster=no: use an existing master, never become one (a
+            # persisting master would hold our capture pipes open)
+            _ssh_argv(timeout, "-o", "ControlMaster=no") + [cmd],
             capture_output=True, text=True, timeout=timeout + 5,
         )
         return result.stdout.strip()
@@ -179,18 +231,44 @@ def _ssh_cmd(cmd: str, timeout: int = 10) -> str:
         return f"ERROR: {e}"
 
 
-def _gh_api(endpoint: str) -> dict | list | None:
-    """Call GitHub API via gh CLI."""
+_SSH_BATCH_MARK = "@@@@"
+
+
+def _ssh_batch(commands: dict[str, str], timeout: int = 30) -> dict[str, str]:
+    """Run several short cmd.exe commands in one SSH session.
+
+    Each command's output is preceded by an echoed marker line, then split
+    back out per key. On an SSH error every key gets the error string, as a
+    single _ssh_cmd would return.
+    """
+    script = " & ".join(f"echo {_SSH_BATCH_MARK}{key} & {cmd}" for key, cmd in commands.items())
+    output = _ssh_cmd(script, timeout)
+    if output.startswith("ERROR:"):
+        return dict.fromkeys(commands, output)
+
+    sections = {key: [] for key in commands}
+    current = None
+    for line in output.splitlines():
+        marker = line.strip()
+        if marker.startswith(_SSH_BATCH_MARK) and marker[len(_SSH_BATCH_MARK):] in sections:
+            current = sections[marker[len(_SSH_BATCH_MARK):]]
+        elif current is not None:
+            current.append(line)
+    return {key: "\n".join(lines).strip() for key, lines in sections.items()}
+
+
+def _gh_api(endpoint: str, token: str | None) -> dict | list | None:
+    """GET a GitHub REST endpoint over the shared pooled client.
+
+    Conditional (ETag) requests: unchanged runs/jobs come back as free 304s.
+    """
+    if not token:
+        return None
     try:
-        result = subprocess.run(
-            ["gh", "api", endpoint],
-            capture_output=True, text=True, timeout=15,
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
+        data, _ = github_get(f"/{endpoint}", token)
+        return data
     except Exception:
-        pass
-    return None
+        return None
 
 
 def _parse_ts(ts: str | None) -> datetime | None:
@@ -218,86 +296,91 @@ def _duration_str(start: datetime | None) -> str:
     return f"{secs // 3600}h{(secs % 3600) // 60:02d}m"
 
 
+def _stage_name(step_name: str) -> str:
+    """High-level stage for a step name (lowercased step name if unmapped)."""
+    stage = STAGE_MAP.get(step_name)
+    return stage if stage is not None else step_name.lower()
+
+
 def _get_job_stage(job: dict) -> tuple[str, str, datetime | None]:
     """Determine current stage, step name, and step start time from a job's steps.
 
     Returns (stage, step_name, started_at).
     """
-    steps = job.get("steps", [])
-    # Find the in_progress step
-    for step in steps:
-        if step.get("status") == "in_progress":
-            name = step["name"]
-            stage = STAGE_MAP.get(name, name.lower())
-            return stage, name, _parse_ts(step.get("started_at"))
-
-    # No in_progress step — find last completed
+    # One pass: the in_progress step wins; otherwise remember the last completed one
     last_completed = None
-    for step in steps:
-        if step.get("status") == "completed":
+    for step in job.get("steps", []):
+        status = step.get("status")
+        if status == "in_progress":
+            name = step["name"]
+            return _stage_name(name), name, _parse_ts(step.get("started_at"))
+        if status == "completed":
             last_completed = step
+
     if last_completed:
         name = last_completed["name"]
-        return f"after {STAGE_MAP.get(name, name.lower())}", name, _parse_ts(last_completed.get("completed_at"))
+        return f"after {_stage_name(name)}", name, _parse_ts(last_completed.get("completed_at"))
 
     return "queued", "", None
 
 
-def _get_repo_jobs(repo: str) -> tuple[str, list]:
-    """Get per-job details for active runs in a repo."""
+def _get_active_runs(repo: str, status: str, token: str | None) -> list[tuple[str, dict]]:
+    """(repo, run) pairs for a repo's workflow runs with the given status."""
+    data = _gh_api(f"repos/{GITHUB_OWNER}/{repo}/actions/runs?status={status}&per_page=100", token)
+    if not data or "workflow_runs" not in data:
+        return []
+    return [(repo, run) for run in data["workflow_runs"]]
+
+
+def _get_run_jobs(repo: str, run: dict, token: str | None) -> list[dict]:
+    """Get per-job details for one active run."""
     jobs = []
-    for status in ["in_progress", "queued"]:
-        data = _gh_api(f"repos/{GITHUB_OWNER}/{repo}/actions/runs?status={status}&per_page=5")
-        if not data or "workflow_runs" not in data:
+    run_id = run["id"]
+    branch = run.get("head_branch", "?")
+    run_url = run["html_url"]
+    run_started = _parse_ts(run.get("run_started_at"))
+
+    jobs_data = _gh_api(f"repos/{GITHUB_OWNER}/{repo}/actions/runs/{run_id}/jobs?per_page=100", token)
+    if not jobs_data or "jobs" not in jobs_data:
+        return jobs
+    for job in jobs_data["jobs"]:
+        job_name = job["name"]
+        job_status = job["status"]
+        conclusion = job.get("conclusion")  # success/failure/cancelled/null
+        job_started = _parse_ts(job.get("started_at"))
+
+        # Skip the "setup" meta-job
+        if job_name.endswith("/ setup") or job_name == "setup":
             continue
-        for run in data["workflow_runs"]:
-            run_id = run["id"]
-            branch = run.get("head_branch", "?")
-            run_url = run["html_url"]
-            run_started = _parse_ts(run.get("run_started_at"))
-
-            # Fetch jobs for this run
-            jobs_data = _gh_api(f"repos/{GITHUB_OWNER}/{repo}/actions/runs/{run_id}/jobs?per_page=30")
-            if not jobs_data or "jobs" not in jobs_data:
-                continue
-            for job in jobs_data["jobs"]:
-                job_name = job["name"]
-                job_status = job["status"]
-                conclusion = job.get("conclusion")  # success/failure/cancelled/null
-                job_started = _parse_ts(job.get("started_at"))
-
-                # Skip the "setup" meta-job
-                if job_name.endswith("/ setup") or job_name == "setup":
-                    continue
-
-                # Only GPU jobs run on self-hosted ROADRUNNER
-                is_self_hosted = "gpu" in job_name.lower() and "cpu" not in job_name.lower()
-
-                # Get current stage from steps (or conclusion for completed)
-                if job_status == "completed":
-                    stage = conclusion or "done"
-                    step_name = ""
-                    step_started = None
-                else:
-                    stage, step_name, step_started = _get_job_stage(job)
-
-                jobs.append({
-                    "repo": repo,
-                    "branch": branch,
-                    "job_name": job_name,
-                    "job_status": job_status,
-                    "conclusion": conclusion,
-                    "self_hosted": is_self_hosted,
-                    "stage": stage,
-                    "step_name": step_name,
-                    "step_started": step_started,
-                    "job_started": job_started,
-                    "run_started": run_started,
-                    "run_id": run_id,
-                    "job_id": job["id"],
-                    "url": run_url,
-                })
-    return repo, jobs
+
+        # Only GPU jobs run on self-hosted ROADRUNNER
+        is_self_hosted = "gpu" in job_name.lower() and "cpu" not in job_name.lower()
+
+        # Get current stage from steps (or conclusion for completed)
+        if job_status == "completed":
+            stage = conclusion or "done"
+            step_name = ""
+            step_started = None
+        else:
+            stage, step_name, step_started = _get_job_stage(job)
+
+        jobs.append({
+            "repo": repo,
+            "branch": branch,
+            "job_name": job_name,
+            "job_status": job_status,
+            "conclusion": conclusion,
+            "self_hosted": is_self_hosted,
+            "stage": stage,
+            "step_name": step_name,
+            "step_started": step_started,
+            "job_started": job_started,
+            "run_started": run_started,
+            "run_id": run_id,
+            "job_id": job["id"],
+            "url": run_url,
+        })
+    return jobs
 
 
 def _format_stage(job: dict) -> str:
@@ -323,17 +406,107 @@ def _format_stage(job: dict) -> str:
     return stage
 
 
-def monitor_runners():
-    """Show runner status, active jobs, disk space, and locks."""
+def _roadrunner_queries() -> dict:
+    """SSH queries for the ROADRUNNER panels: key -> (label, func, args, kwargs)."""
+    # Short cmd.exe probes share one SSH session, split back apart by key. WSL probes
+    # stay out: a cold WSL start can stall the session and blank every panel
+    quick_probes = {
+        "win_disk": 'powershell -command "Get-PSDrive C | ForEach-Object { Write-Host ([math]::Round($_.Used/1GB,1)) ([math]::Round($_.Free/1GB,1)) }"',
+        "locks": (
+            'cmd /c "if exist C:\\gpu-lock (type C:\\gpu-lock\\owner 2>nul || echo locked-no-owner) else (echo free)" & '
+            'cmd /c "if exist C:\\windows-gpu-lock (echo locked) else (echo free)" & '
+            'cmd /c "if exist C:\\windows-portable-gpu-lock (echo locked) else (echo free)" & '
+            'cmd /c "if exist C:\\linux-gpu-lock (echo locked) else (echo free)"'
+        ),
+        "nvidia": 'nvidia-smi --query-gpu=utilization.gpu,memory.used,memory.total --format=csv,noheader,nounits',
+        "gpu_procs": 'nvidia-smi --query-compute-apps=pid,used_gpu_memory,process_name --format=csv,noheader,nounits',
+    }
 
-    # --- Per-job details across all repos (parallel) ---
+    # Define all SSH queries with labels for progress tracking; the slow scans
+    # stay in their own sessions so they run concurrently
+    queries = {
+        # Serial in one session, so the timeout covers the probes' separate ones (10+10+15+15)
+        "quick": ("Win disk/locks/GPU", _ssh_batch, (quick_probes, 50), {}),
+        "wsl_disk": ("WSL disk", _ssh_cmd, ('wsl -e df -h / --output=size,used,avail,pcent 2>nul', 15), {}),
+        "xwayland": ("Xwayland", _ssh_cmd, (
+            'wsl -- bash -c "pgrep Xwayland >/dev/null 2>&1 && echo RUNNING || echo NOT_RUNNING"',
+            10,
+        ), {}),
+        "caches_wsl": ("WSL caches", _ssh_cmd, (
+            'wsl -- bash -c "du -sh'
+            ' /home/administrator/.ce'
+            ' /home/administrator/.rattler'
+            ' /home/administrator/.cache/rattler'
+            ' /home/administrator/.cache/uv'
+            ' /home/administrator/.cache/pip'
+            ' /home/administrator/.cache/huggingface'
+            ' 2>/dev/null; true"',
+            90,
+        ), {}),
+        "caches_win": ("Win caches", _ssh_cmd, (
+            'cmd /c "for %d in ('
+            "C:\\ce "
+            "C:\\Users\\Administrator\\.rattler "
+            "C:\\Users\\Administrator\\AppData\\Local\\rattler "
+            "C:\\Users\\Administrator\\AppData\\Local\\uv "
+            "C:\\Users\\Administrator\\AppData\\Local\\pip "
+            "C:\\Users\\Administrator\\.cache\\huggingface"
+            ') do @if exist %d ('
+            'echo ====%d '
+            "& robocopy %d %d\\..\\__fake /L /S /NJH /NFL /NDL /BYTES /R:0 /W:0 2>nul"
+            ')"',
+            120,
+        ), {}),
+        "runners_wsl": ("WSL runner folders", _ssh_cmd, (
+            'wsl -- bash -c "du -sh /home/administrator/github-runners/PozzettiAndrea-*/_work 2>/dev/null; true"',
+            90,
+        ), {}),
+        "runners_win": ("Win runner folders", _ssh_cmd, (
+            'cmd /c "for /d %d in (C:\\github-runners\\PozzettiAndrea-*) do @if exist %d\\_work ('
+            'echo ====%d '
+            "& robocopy %d\\_work %d\\_work\\..\\__fake /L /S /NJH /NFL /NDL /BYTES /R:0 /W:0 2>nul"
+            ')"',
+            120,
+        ), {}),
+        "ce_envs_win": ("Win CE envs", _ssh_cmd, (
+            'cmd /c "for /d %d in (C:\\ce\\_env_*) do @('
+            'echo ====%~nxd '
+            '& type %d\\.comfy-env-meta.json 2>nul '
+            '& robocopy %d %d\\..\\__fake /L /S /NJH /NFL /NDL /BYTES /R:0 /W:0 2>nul'
+            ')"',
+            120,
+        ), {}),
+        "ce_envs_wsl": ("WSL CE envs", _ssh_cmd, (
+            r'wsl -- bash -c "for d in /home/administrator/.ce/_env_*/; do echo ====\$(basename \$d); du -sh \$d 2>/dev/null; grep node_name \$d/.comfy-env-meta.json 2>/dev/null; done"',
+            90,
+        ), {}),
+    }
+    return queries
+
+
+def _show_job_activity():
+    """Print the self-hosted and cloud job tables for all runner repos."""
     console.print("[bold blue]Fetching runner activity...[/bold blue]")
+    token = get_github_token()
+    if not token:
+        console.print("[yellow]No GitHub token (GITHUB_TOKEN or gh auth); skipping job activity[/yellow]")
     all_jobs = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(_get_repo_jobs, repo): repo for repo in RUNNER_REPOS}
-        for future in as_completed(futures):
-            repo, jobs = future.result()
-            all_jobs.extend(jobs)
+    # Two flat rounds instead of per-repo serial chains: every runs query at
+    # once, then every active run's jobs. 8 workers stays clear of GitHub's
+    # secondary rate limits
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        run_futures = [
+            executor.submit(_get_active_runs, repo, status, token)
+            for repo in RUNNER_REPOS
+            for status in ("in_progress", "queued")
+        ]
+        job_futures = [
+            executor.submit(_get_run_jobs, repo, run, token)
+            for future in as_completed(run_futures)
+            for repo, run in future.result()
+        ]
+        for future in as_completed(job_futures):
+            all_jobs.extend(future.result())
 
     # Split GPU (self-hosted) vs CPU (cloud)
     self_hosted = [j for j in all_jobs if j["self_hosted"]]
@@ -398,100 +571,46 @@ def monitor_runners():
     if not self_hosted and not cloud:
         console.print("[dim]No active or queued jobs[/dim]")
 
-    # --- System info from ROADRUNNER ---
-    host, _, _ = _get_roadrunner_creds()
-    console.print(f"\n[bold blue]Checking ROADRUNNER[/bold blue] [dim]({host})[/dim][bold blue]...[/bold blue]")
 
-    # Define all SSH queries with labels for progress tracking
-    queries = {
-        "win_disk": ("Win disk", _ssh_cmd, (
-            'powershell -command "Get-PSDrive C | ForEach-Object { Write-Host ([math]::Round($_.Used/1GB,1)) ([math]::Round($_.Free/1GB,1)) }"',
-        ), {}),
-        "locks": ("Locks", _ssh_cmd, (
-            'cmd /c "if exist C:\\gpu-lock (type C:\\gpu-lock\\owner 2>nul || echo locked-no-owner) else (echo free)" & '
-            'cmd /c "if exist C:\\windows-gpu-lock (echo locked) else (echo free)" & '
-            'cmd /c "if exist C:\\windows-portable-gpu-lock (echo locked) else (echo free)" & '
-            'cmd /c "if exist C:\\linux-gpu-lock (echo locked) else (echo free)"',
-        ), {}),
-        "nvidia": ("GPU info", _ssh_cmd, (
-            'nvidia-smi --query-gpu=utilization.gpu,memory.used,memory.total --format=csv,noheader,nounits',
-            15,
-        ), {}),
-        "gpu_procs": ("GPU processes", _ssh_cmd, (
-            'nvidia-smi --query-compute-apps=pid,used_gpu_memory,process_name --format=csv,noheader,nounits',
-            15,
-        ), {}),
-        "wsl_disk": ("WSL disk", _ssh_cmd, (
-            'wsl -e df -h / --output=size,used,avail,pcent 2>nul',
-            15,
-        ), {}),
-        "caches_wsl": ("WSL caches", _ssh_cmd, (
-            'wsl -- bash -c "du -sh'
-            ' /home/administrator/.ce'
-            ' /home/administrator/.rattler'
-            ' /home/administrator/.cache/rattler'
-            ' /home/administrator/.cache/uv'
-            ' /home/administrator/.cache/pip'
-            ' /home/administrator/.cache/huggingface'
-            ' 2>/dev/null; true"',
-            90,
-        ), {}),
-        "caches_win": ("Win caches", _ssh_cmd, (
-            'cmd /c "for %d in ('
-            "C:\\ce "
-            "C:\\Users\\Administrator\\.rattler "
-            "C:\\Users\\Administrator\\AppData\\Local\\rattler "
-            "C:\\Users\\Administrator\\AppData\\Local\\uv "
-            "C:\\Users\\Administrator\\AppData\\Local\\pip "
-            "C:\\Users\\Administrator\\.cache\\huggingface"
-            ') do @if exist %d ('
-            'echo ====%d '
-            "& robocopy %d %d\\..\\__fake /L /S /NJH /NFL /NDL /BYTES /R:0 /W:0 2>nul"
-            ')"',
-            120,
-        ), {}),
-        "xwayland": ("Xwayland", _ssh_cmd, (
-            'wsl -- bash -c "pgrep Xwayland >/dev/null 2>&1 && echo RUNNING || echo NOT_RUNNING"',
-            10,
-        ), {}),
-        "runners_wsl": ("WSL runner folders", _ssh_cmd, (
-            'wsl -- bash -c "du -sh /home/administrator/github-runners/PozzettiAndrea-*/_work 2>/dev/null; true"',
-            90,
-        ), {}),
-        "runners_win": ("Win runner folders", _ssh_cmd, (
-            'cmd /c "for /d %d in (C:\\github-runners\\PozzettiAndrea-*) do @if exist %d\\_work ('
-            'echo ====%d '
-            "& robocopy %d\\_work %d\\_work\\..\\__fake /L /S /NJH /NFL /NDL /BYTES /R:0 /W:0 2>nul"
-            ')"',
-            120,
-        ), {}),
-        "ce_envs_win": ("Win CE envs", _ssh_cmd, (
-            'cmd /c "for /d %d in (C:\\ce\\_env_*) do @('
-            'echo ====%~nxd '
-            '& type %d\\.comfy-env-meta.json 2>nul '
-            '& robocopy %d %d\\..\\__fake /L /S /NJH /NFL /NDL /BYTES /R:0 /W:0 2>nul'
-            ')"',
-            120,
-        ), {}),
-        "ce_envs_wsl": ("WSL CE envs", _ssh_cmd, (
-            r'wsl -- bash -c "for d in /home/administrator/.ce/_env_*/; do echo ====\$(basename \$d); du -sh \$d 2>/dev/null; grep node_name \$d/.comfy-env-meta.json 2>/dev/null; done"',
-            90,
-        ), {}),
-    }
+def monitor_runners():
+    """Show runner status, active jobs, disk space, and locks."""
 
-    # Launch all SSH commands in parallel with live progress
-    results = {}
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_key = {}
-        for key, (label, func, args, kwargs) in queries.items():
-            future = executor.submit(func, *args, **kwargs)
-            future_to_key[future] = key
+    # Without ROADRUNNER credentials there is nothing to overlap: still show the
+    # GitHub side, then report the missing variables
+    if not all(os.environ.get(k) for k in ("ROADRUNNER_HOST", "ROADRUNNER_USER", "ROADRUNNER_PASS")):
+        _show_job_activity()
+        _get_roadrunner_creds()
 
+    # --- Start the ROADRUNNER SSH queries first; they run while GitHub is queried ---
+    host, _, _ = _get_roadrunner_creds()
+    queries = _roadrunner_queries()
+    with ThreadPoolExecutor(max_workers=len(queries) + 1) as ssh_executor:
+        # One authenticated connection for all the queries: they wait for it, then multiplex over it
+        master = ssh_executor.submit(_ssh_start_master)
+
+        def after_master(func, *args, **kwargs):
+            master.result()
+            return func(*args, **kwargs)
+
+        future_to_key = {
+            ssh_executor.submit(after_master, func, *args, **kwargs): key
+            for key, (label, func, args, kwargs) in queries.items()
+        }
+
+        # --- Per-job details across all repos (parallel) ---
+        _show_job_activity()
+
+        # --- System info from ROADRUNNER (queries have been running since the start) ---
+        console.print(f"\n[bold blue]Checking ROADRUNNER[/bold blue] [dim]({host})[/dim][bold blue]...[/bold blue]")
+        results = {}
         pending = {k: v[0] for k, v in queries.items()}  # key -> label
         with console.status("") as status:
             for future in as_completed(future_to_key):
                 key = future_to_key[future]
-                results[key] = future.result()
+                if key == "quick":
+                    results.update(future.result())
+                else:
+                    results[key] = future.result()
                 del pending[key]
                 if pending:
                     waiting = ", ".join(pending.values())
@@ -516,9 +635,10 @@ def monitor_runners():
         parts = win_disk.split()
         if len(parts) >= 2:
             used, free = parts[0], parts[1]
-            total = round(float(used) + float(free), 1)
-            pct = round(float(used) / total * 100)
-            color = "red" if float(free) < 20 else "yellow" if float(free) < 50 else "green"
+            used_gb, free_gb = float(used), float(free)
+            total = round(used_gb + free_gb, 1)
+            pct = round(used_gb / total * 100)
+            color = "red" if free_gb < 20 else "yellow" if free_gb < 50 else "green"
             disk_lines.append(f"[bold]Windows C:[/bold]  {used}GB / {total}GB used ([{color}]{free}GB free, {pct}%[/{color}])")
     else:
         disk_lines.append(f"[red]Windows: {win_disk}[/red]")
@@ -632,7 +752,8 @@ def monitor_runners():
         parts = nvidia.split(",")
         if len(parts) >= 3:
             gpu_util, mem_used, mem_total = [p.strip() for p in parts]
-            color = "red" if int(gpu_util) > 80 else "yellow" if int(gpu_util) > 20 else "green"
+            util = int(gpu_util)
+            color = "red" if util > 80 else "yellow" if util > 20 else "green"
             gpu_lines.append(f"Utilization: [{color}]{gpu_util}%[/{color}]  VRAM: {mem_used}/{mem_total} MiB")
     else:
         gpu_lines.append(f"[dim]{nvidia}[/dim]")
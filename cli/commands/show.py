@@ -97,10 +97,11 @@ def find_latest_log(repo_name: str, timestamp: str = None) -> Optional[Path]:
     repo_lower = repo_name.lower().replace("-", "").replace("_", "")
     candidates = []
 
-    for folder in logs_dir.iterdir():
-        if not folder.is_dir():
-            continue
+    # scandir: is_dir() comes from the dirent type and stat() is cached per entry
+    with os.scandir(logs_dir) as it:
+        folders = [e for e in it if e.is_dir()]
 
+    for folder in folders:
         parts = folder.name.rsplit("-", 1)
         if len(parts) < 2:
             continue
@@ -111,28 +112,27 @@ def find_latest_log(repo_name: str, timestamp: str = None) -> Optional[Path]:
         if repo_lower == base_lower:
             if timestamp:
                 if folder_timestamp == timestamp:
-                    return folder
+                    return Path(folder.path)
             else:
                 candidates.append(folder)
 
     if not candidates:
         return None
 
-    candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return candidates[0]
+    return Path(max(candidates, key=lambda e: e.stat().st_mtime).path)
 
 
 def find_branches(log_folder: Path) -> list[Path]:
     """Find branch folders (directories containing platform subdirs)."""
     branches = []
-    for subdir in log_folder.iterdir():
-        if not subdir.is_dir() or subdir.name.startswith('.'):
-            continue
-        # A branch folder contains at least one platform subdir
-        for platform_id in PLATFORM_IDS:
-            if (subdir / platform_id).exists():
-                branches.append(subdir)
-                break
+    with os.scandir(log_folder) as it:
+        for subdir in it:
+            if not subdir.is_dir() or subdir.name.startswith('.'):
+                continue
+            # A branch folder contains at least one platform subdir (one listing, not a stat per id)
+            with os.scandir(subdir.path) as children:
+                if any(c.name in PLATFORM_IDS for c in children):
+                    branches.append(Path(subdir.path))
     return branches
 
 
@@ -5,10 +5,9 @@ import subprocess
 import shutil
 from pathlib import Path
 from rich.console import Console
-import yaml
 from commands.clone_utils import clone_utils_repos
-from commands.get import setup_comfyui, CONFIG_DIR, INSTALL_DIR
-from config import UTILS_REPOS_DIR, COMMAND_NAME
+from commands.get import setup_comfyui, list_config_names, CONFIG_DIR, INSTALL_DIR
+from config import UTILS_REPOS_DIR, COMMAND_NAME, load_yaml
 
 console = Console()
 
@@ -82,22 +81,21 @@ def find_repo(repo_name: str) -> Path | None:
 
     # Find matching config file
     config_file = None
-    for f in CONFIG_DIR.glob("*.yml"):
-        if f.stem.lower().replace("-", "") == config_name:
-            config_file = f
+    available = list_config_names()
+    for name in available:
+        if name.lower().replace("-", "") == config_name:
+            config_file = CONFIG_DIR / f"{name}.yml"
             break
 
     if not config_file:
         console.print(f"[red]No setup config found for: {repo_name}[/red]")
         console.print(f"[dim]Looked in: {CONFIG_DIR}[/dim]")
-        available = sorted([f.stem for f in CONFIG_DIR.glob("*.yml")])
         if available:
             console.print(f"[dim]Available: {', '.join(available[:10])}[/dim]")
         return None
 
     # Load config to get folder name and node URL
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(config_file)
 
     folder_name = config.get("folder_name", config_file.stem)
     nodes_to_install = config.get("nodes_to_install", [])
@@ -3,7 +3,10 @@
 import json
 import os
 import platform
+import sqlite3
 import subprocess
+from contextlib import closing
+from functools import cache, lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
@@ -11,6 +14,35 @@ from typing import Optional
 import yaml
 from dotenv import load_dotenv
 
+# orjson decodes large API responses several times faster; stdlib json accepts bytes too
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# libyaml-backed loader when PyYAML was built with it; the pure-Python parser is much slower
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path_str: str, mtime_ns: int):
+    with open(path_str, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml(path):
+    """Parse a YAML file, reusing the result until its mtime changes.
+
+    The returned object is shared between callers; treat it as read-only.
+    """
+    path = Path(path)
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
+
+
 # Paths - CDS_ROOT points to comfy-dev-cli/, ROOT_DIR is its parent (coding-scripts/)
 # Use CDS_ROOT env var if set, otherwise fall back to D:\coding-scripts (default dev location)
 _default_root = "D:\\coding-scripts" if platform.system() == "Windows" else str(Path(__file__).resolve().parent.parent.parent)
@@ -50,9 +82,8 @@ def _load_github_owner() -> str:
         return os.environ["GITHUB_OWNER"]
     identity_file = PRIVATE_DIR / "identity.yml"
     if identity_file.exists():
-        with open(identity_file) as f:
-            identity = yaml.safe_load(f)
-            return identity.get("github_owner", "")
+        identity = load_yaml(identity_file)
+        return identity.get("github_owner", "")
     return ""
 
 GITHUB_OWNER = _load_github_owner()
@@ -82,10 +113,20 @@ class Repo:
 
 
 def load_repos_from_json() -> list[Repo]:
-    """Load repos from repo_data.json if it exists."""
-    if not REPO_DATA_FILE.exists():
+    """Load repos from repo_data.json if it exists.
+
+    Parsed once per file version (keyed on mtime), so repeated calls within
+    a process, e.g. from the dashboard, skip re-reading the JSON.
+    """
+    try:
+        mtime_ns = REPO_DATA_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
+    return list(_load_repos_from_json_cached(mtime_ns))
+
 
+@lru_cache(maxsize=1)
+def _load_repos_from_json_cached(mtime_ns: int) -> tuple[Repo, ...]:
     with open(REPO_DATA_FILE) as f:
         data = json.load(f)
 
@@ -109,7 +150,7 @@ def load_repos_from_json() -> list[Repo]:
             url=item.get("url", item.get("html_url", "")),
             visibility=item.get("visibility", "public"),
         ))
-    return repos
+    return tuple(repos)
 
 
 def load_repos_from_csv() -> list[tuple[str, str, str]]:
@@ -159,8 +200,7 @@ def get_repo_config_map() -> dict[str, tuple[str, str]]:
     setup_dir = Path(__file__).parent.parent / "config" / "setup"
     mapping = {}
     for config_file in setup_dir.glob("*.yml"):
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(config_file)
         if not config:
             continue
         config_name = config_file.stem
@@ -195,16 +235,27 @@ def load_reddit_links() -> list[str]:
         return [line.strip() for line in f if line.strip()]
 
 
+@cache
+def github_client(token: str):
+    """Shared PyGithub client per token (PyGithub is imported on first use only).
+
+    per_page=100 cuts paginated requests ~3x vs the default 30; the pool lets
+    the thread-pooled stats fetch reuse connections instead of one client per repo.
+    """
+    from github import Auth, Github
+
+    return Github(auth=Auth.Token(token), per_page=100, pool_size=32)
+
+
 def refresh_repo_data() -> bool:
     """Fetch fresh repo data from GitHub and update repo_data.json."""
     token = os.environ.get("GITHUB_TOKEN")
     if not token:
         return False
 
-    from github import Github
     from datetime import datetime
 
-    g = Github(token)
+    g = github_client(token)
     csv_repos = load_repos_from_csv()
     if not csv_repos:
         # Fallback: get from existing JSON
@@ -250,6 +301,178 @@ def refresh_repo_data() -> bool:
 
 
 REPO_STATS_FILE = COMMAND_CENTER_DIR / "repo_stats.json"
+GITHUB_API_URL = "https://api.github.com"
+GH_HTTP_CACHE_FILE = COMMAND_CENTER_DIR / "gh_http_cache.db"
+
+
+@cache
+def _gh_cache_init() -> None:
+    """Create the ETag response cache schema once per process.
+
+    WAL mode is persistent in the database file, so it only needs setting here.
+    """
+    GH_HTTP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(GH_HTTP_CACHE_FILE, timeout=30)) as conn, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, next_url TEXT, body BLOB)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS graphql_responses "
+            "(key TEXT PRIMARY KEY, fetched_at REAL, body BLOB)"
+        )
+
+
+def _gh_cache_connect() -> sqlite3.Connection:
+    """Open the ETag response cache (one connection per call, safe across threads)."""
+    _gh_cache_init()
+    return sqlite3.connect(GH_HTTP_CACHE_FILE, timeout=30)
+
+
+@cache
+def http2_available() -> bool:
+    """True when the optional h2 package (httpx[http2]) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@cache
+def github_http():
+    """Process-wide httpx client for api.github.com, shared by all threads.
+
+    Keeps TLS connections alive between requests; uses HTTP/2 (one multiplexed
+    connection) when the optional h2 package is installed (httpx[http2]).
+    """
+    import atexit
+    import httpx
+
+    client = httpx.Client(
+        http2=http2_available(),
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        timeout=30,
+    )
+    atexit.register(client.close)
+    return client
+
+
+GITHUB_RETRY_ATTEMPTS = 3
+
+
+def _github_request(method: str, url: str, **kwargs):
+    """Send a request via github_http(), retrying rate limits and 5xx with exponential backoff."""
+    import time
+
+    for attempt in range(GITHUB_RETRY_ATTEMPTS):
+        response = github_http().request(method, url, **kwargs)
+        # Secondary rate limits come back as 403 with Retry-After; primary ones with remaining=0
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403
+            and ("retry-after" in response.headers or response.headers.get("x-ratelimit-remaining") == "0")
+        )
+        if not (rate_limited or response.status_code >= 500) or attempt == GITHUB_RETRY_ATTEMPTS - 1:
+            return response
+        retry_after = response.headers.get("retry-after")
+        delay = int(retry_after) if retry_after and retry_after.isdigit() else 2 ** (attempt + 1)
+        time.sleep(min(delay, 30))
+    return response
+
+
+def github_get(url: str, token: str, refresh: bool = False) -> tuple[object, str | None]:
+    """GET a GitHub REST endpoint using a conditional request against the on-disk cache.
+
+    Sends If-None-Match / If-Modified-Since for previously seen URLs; a 304
+    returns the cached body and does not count against the rate limit.
+    refresh=True skips the conditional headers (the fresh response is still cached).
+    Returns (parsed JSON, next page URL or None).
+    """
+    if url.startswith("/"):
+        url = GITHUB_API_URL + url
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    }
+    cached = None
+    if not refresh:
+        with closing(_gh_cache_connect()) as conn:
+            cached = conn.execute(
+                "SELECT etag, last_modified, next_url, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+    if cached:
+        if cached[0]:
+            headers["If-None-Match"] = cached[0]
+        if cached[1]:
+            headers["If-Modified-Since"] = cached[1]
+
+    response = _github_request("GET", url, headers=headers)
+    if response.status_code == 304 and cached:
+        return json.loads(cached[3]), cached[2]
+    response.raise_for_status()
+
+    next_url = response.links.get("next", {}).get("url")
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with closing(_gh_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, next_url, response.content),
+            )
+    return response.json(), next_url
+
+
+def github_graphql(query: str, variables: dict, token: str, max_age: float = 0) -> dict:
+    """Run a GitHub GraphQL query and return the parsed response (data + errors).
+
+    GraphQL has no ETags, so with max_age > 0 a successful response is reused
+    from the on-disk cache for that many seconds instead.
+    """
+    import hashlib
+    import time
+
+    key = None
+    if max_age > 0:
+        key = hashlib.sha256(json.dumps([query, variables], sort_keys=True).encode()).hexdigest()
+        with closing(_gh_cache_connect()) as conn:
+            cached = conn.execute(
+                "SELECT fetched_at, body FROM graphql_responses WHERE key = ?", (key,)
+            ).fetchone()
+        if cached and time.time() - cached[0] < max_age:
+            return _json_loads(cached[1])
+
+    response = _github_request(
+        "POST",
+        GITHUB_API_URL + "/graphql",
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=60,
+    )
+    response.raise_for_status()
+    # Issue bodies make these responses large; decode them with orjson when available
+    result = _json_loads(response.content)
+    if key and not result.get("errors"):
+        with closing(_gh_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO graphql_responses VALUES (?, ?, ?)",
+                (key, time.time(), response.content),
+            )
+    return result
+
+
+def github_iter(url: str, token: str, refresh: bool = False):
+    """Yield the items of a paginated GitHub REST list endpoint page by page via github_get()."""
+    while url:
+        page, url = github_get(url, token, refresh)
+        yield from page
+
+
+def github_get_all(url: str, token: str, refresh: bool = False) -> list:
+    """GET every page of a paginated GitHub REST list endpoint via github_get()."""
+    return list(github_iter(url, token, refresh))
 
 # Cached stats loaded at startup
 _cached_repo_stats = {}
@@ -257,9 +480,6 @@ _cached_repo_stats = {}
 
 def _fetch_single_repo_stats(repo_name: str, token: str) -> tuple[str, dict]:
     """Fetch stats for a single repo. Used by thread pool."""
-    import httpx
-    from github import Github
-
     repo_stats = {
         "discussions": 0, "unanswered": 0, "waiting_on_op": 0,
         "active_forks": 0, "open_prs": 0,
@@ -293,7 +513,7 @@ def _fetch_single_repo_stats(repo_name: str, token: str) -> tuple[str, dict]:
     # Fetch discussions via GraphQL
     discussions_list = []
     try:
-        response = httpx.post(
+        response = github_http().post(
             "https://api.github.com/graphql",
             json={
                 "query": discussion_query,
@@ -329,29 +549,29 @@ def _fetch_single_repo_stats(repo_name: str, token: str) -> tuple[str, dict]:
 
     # Fetch waiting-on-OP issues and active forks via REST API
     try:
-        g = Github(token)
+        g = github_client(token)
         gh_repo = g.get_repo(f"{GITHUB_OWNER}/{repo_name}")
 
         # Count open PRs
         repo_stats["open_prs"] = gh_repo.get_pulls(state="open").totalCount
 
-        # Fetch issues with details
+        # Fetch issues with details (conditional GETs, unchanged pages come back as 304s)
         issues_list = []
-        for issue in gh_repo.get_issues(state="open"):
-            if issue.pull_request:
+        for issue in github_iter(f"/repos/{GITHUB_OWNER}/{repo_name}/issues?state=open&per_page=100", token):
+            if "pull_request" in issue:
                 continue
-            comments = list(issue.get_comments())
-            waiting_on_op = comments and comments[-1].user.login == GITHUB_OWNER
+            comments = github_get_all(f"{issue['comments_url']}?per_page=100", token) if issue["comments"] else []
+            waiting_on_op = bool(comments) and comments[-1]["user"]["login"] == GITHUB_OWNER
             if waiting_on_op:
                 repo_stats["waiting_on_op"] += 1
             issues_list.append({
-                "title": issue.title,
-                "url": issue.html_url,
-                "number": issue.number,
-                "author": issue.user.login,
-                "created": issue.created_at.strftime("%Y-%m-%d"),
-                "comments": issue.comments,
-                "labels": [l.name for l in issue.labels],
+                "title": issue["title"],
+                "url": issue["html_url"],
+                "number": issue["number"],
+                "author": issue["user"]["login"],
+                "created": issue["created_at"][:10],
+                "comments": issue["comments"],
+                "labels": [l["name"] for l in issue["labels"]],
                 "waiting_on_op": waiting_on_op,
             })
         repo_stats["issues_list"] = issues_list
@@ -616,9 +836,7 @@ def get_3d_index_config() -> dict:
     global _3D_INDEX_CONFIG
     if _3D_INDEX_CONFIG is None:
         if _3D_INDEX_CONFIG_FILE.exists():
-            import yaml
-            with open(_3D_INDEX_CONFIG_FILE) as f:
-                _3D_INDEX_CONFIG = yaml.safe_load(f)
+            _3D_INDEX_CONFIG = load_yaml(_3D_INDEX_CONFIG_FILE)
         else:
             _3D_INDEX_CONFIG = {}
     return _3D_INDEX_CONFIG
@@ -349,32 +349,36 @@ def monitor_dashboard(
 def monitor_license(
     repo_name: str = typer.Option(None, "--repo", "-r", help="Filter by repo name"),
     deep: bool = typer.Option(False, "--deep", "-d", help="Deep AI-powered license analysis"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-analyze repos even if their HEAD is unchanged (--deep)"),
 ):
     """Audit licenses across all repos."""
     require_github_token()
     from commands.license import audit_licenses, deep_audit_licenses
     if deep:
-        deep_audit_licenses(repo_name)
+        deep_audit_licenses(repo_name, use_cache=not no_cache)
     else:
         audit_licenses(repo_name)
 
 
 @monitor_app.command("download-issues")
-def monitor_download_issues():
+def monitor_download_issues(
+    refresh: bool = typer.Option(False, "--refresh", "-r", help="Bypass the GitHub response cache"),
+):
     """Download issues from a repo as txt files."""
     require_github_token()
     from commands.download_issues import download_issues as dl_issues
-    dl_issues()
+    dl_issues(refresh)
 
 
 @monitor_app.command("download-all-issues")
 def monitor_download_all_issues(
     include_closed: bool = typer.Option(False, "--closed", "-c", help="Include closed issues"),
+    refresh: bool = typer.Option(False, "--refresh", "-r", help="Bypass the GitHub response cache"),
 ):
     """Download issues from ALL repos to ~/issues/{repo}/."""
     require_github_token()
     from commands.download_all_issues import download_all_issues as dl_all
-    dl_all(include_closed)
+    dl_all(include_closed, refresh)
 
 
 @monitor_app.command("pages")
@@ -3,7 +3,6 @@
 import json
 import os
 import re
-from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 from pathlib import Path
 
@@ -18,6 +17,16 @@ from .patterns import (
 )
 
 
+def _urlopen(url, headers, timeout):
+    """urlopen with urllib.request imported on first use.
+
+    It pulls in ssl/http.client/email (~30ms), and this module is imported
+    on every CLI start via the oneshot command group.
+    """
+    from urllib.request import Request, urlopen
+    return urlopen(Request(url, headers=headers), timeout=timeout)
+
+
 def _clean_hf_url(url):
     """Clean up a HuggingFace URL, removing trailing junk."""
     # Remove trailing markdown/parentheses junk
@@ -89,8 +98,7 @@ def search_huggingface_api(repo_name, org=None):
         try:
             # Search by model name
             url = f"https://huggingface.co/api/models?search={term}&limit=10"
-            req = Request(url, headers={"User-Agent": "repo-validator/1.0"})
-            with urlopen(req, timeout=10) as resp:
+            with _urlopen(url, {"User-Agent": "repo-validator/1.0"}, timeout=10) as resp:
                 models = json.loads(resp.read())
                 for model in models:
                     model_id = model.get("modelId", "")
@@ -109,8 +117,7 @@ def search_huggingface_api(repo_name, org=None):
     if org:
         try:
             url = f"https://huggingface.co/api/models?author={org}&limit=20"
-            req = Request(url, headers={"User-Agent": "repo-validator/1.0"})
-            with urlopen(req, timeout=10) as resp:
+            with _urlopen(url, {"User-Agent": "repo-validator/1.0"}, timeout=10) as resp:
                 models = json.loads(resp.read())
                 for model in models:
                     model_id = model.get("modelId", "")
@@ -216,8 +223,7 @@ def fetch_github_metadata(owner, repo, token=None):
         headers["Authorization"] = f"Bearer {token}"
 
     try:
-        req = Request(url, headers=headers)
-        with urlopen(req, timeout=15) as resp:
+        with _urlopen(url, headers, timeout=15) as resp:
             data = json.loads(resp.read())
             return {
                 "full_name": data.get("full_name"),
@@ -262,8 +268,7 @@ def fetch_readme(owner, repo, token=None, default_branch="main"):
         for readme in readme_names:
             url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{readme}"
             try:
-                req = Request(url, headers=headers)
-                with urlopen(req, timeout=10) as resp:
+                with _urlopen(url, headers, timeout=10) as resp:
                     return resp.read().decode('utf-8', errors='ignore')
             except (HTTPError, URLError):
                 continue
@@ -303,8 +308,7 @@ def download_paper_pdf(paper_url, dest_path):
         pdf_url = paper_url
 
     try:
-        req = Request(pdf_url, headers={"User-Agent": "oneshot-wrapper/1.0"})
-        with urlopen(req, timeout=60) as resp:
+        with _urlopen(pdf_url, {"User-Agent": "oneshot-wrapper/1.0"}, timeout=60) as resp:
             dest_path = Path(dest_path)
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             with open(dest_path, 'wb') as f:
@@ -336,9 +340,7 @@ def fetch_hf_model_files(model_id):
     try:
         # Get file tree from HF API (recursive to get all files in folders)
         tree_url = f"https://huggingface.co/api/models/{model_id}/tree/main?recursive=true"
-        req = Request(tree_url, headers={"User-Agent": "oneshot-wrapper/1.0"})
-
-        with urlopen(req, timeout=60) as resp:
+        with _urlopen(tree_url, {"User-Agent": "oneshot-wrapper/1.0"}, timeout=60) as resp:
             files_data = json.loads(resp.read())
 
         files = []